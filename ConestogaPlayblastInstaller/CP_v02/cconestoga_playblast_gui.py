@@ -335,7 +335,7 @@ def create_playblast_from_ui(output_dir_field, filename_field, camera_menu,
             encoder=encoder,
             quality=quality,
             shot_mask=shot_mask,
-            show_in_viewer=show_in_viewer,
+            open_in_viewer=show_in_viewer,
             force_overwrite=force_overwrite
         )
         
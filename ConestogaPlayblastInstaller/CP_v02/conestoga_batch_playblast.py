@@ -22,13 +22,15 @@ if script_dir not in sys.path:
 import conestoga_playblast
 import conestoga_playblast_utils as utils
 
-def batch_playblast_cameras(cameras=None, settings=None):
+def batch_playblast_cameras(cameras=None, settings=None, combine=None):
     """
     Create playblasts for multiple cameras.
     
     Args:
         cameras (list): List of camera names (None = use all cameras)
         settings (dict): Playblast settings
+        combine (bool): Encode every camera into one movie with a single
+            ffmpeg process (None = use the batchCombineCameras option)
         
     Returns:
         list: Paths to created playblasts
@@ -61,7 +63,7 @@ def batch_playblast_cameras(cameras=None, settings=None):
         settings['filename'] = f"{filename}_{{camera}}"
     
     # Batch process cameras
-    return conestoga_playblast.batch_playblast(cameras, settings=settings)
+    return conestoga_playblast.batch_playblast(cameras, settings=settings, combine=combine)
 
 def batch_playblast_scenes(scene_files, settings=None, camera=None):
     """
@@ -19,7 +19,7 @@ Usage:
         start_frame=1,
         end_frame=100,
         shot_mask=True,
-        show_in_viewer=True
+        open_in_viewer=True
     )
 """
 
@@ -28,106 +28,263 @@ Usage:
 ################################################################################
 import os
 import re
+import atexit
+import collections
+import contextlib
 import sys
-import json
-import time
-import glob
-import shutil
-import tempfile
-import datetime
-import subprocess
-import traceback
-from functools import partial
-import getpass
+import concurrent.futures
+from functools import lru_cache
+from pathlib import Path
+from dataclasses import dataclass, field
 
 import maya.cmds as cmds
-import maya.mel as mel
 
-# Set up Qt imports with proper fallbacks
-QtGui = None
-QtCore = None
-for module_name in ("PySide6", "PySide2"):
-    try:
-        module = __import__(module_name, fromlist=["QtGui", "QtCore"])
+# maya.mel and Qt are imported on first use: headless mayapy batch jobs never
+# need Qt, and plugin load should not pay for it. Rarely used standard library
+# modules are imported inside the functions that need them for the same reason.
+
+def _get_mel():
+    """Import maya.mel on first use."""
+    global mel
+    import maya.mel as mel
+    return mel
+
+def _ensure_qt():
+    """
+    Import the Qt modules on first use, preferring PySide6 over PySide2.
+
+    Returns:
+        tuple: (QtGui, QtCore), or (None, None) if Qt is not available.
+    """
+    global QtGui, QtCore
+    for module_name in ("PySide6", "PySide2"):
+        try:
+            module = __import__(module_name, fromlist=["QtGui", "QtCore"])
+        except ImportError:
+            continue
         QtGui = module.QtGui
         QtCore = module.QtCore
-        break
-    except ImportError:
-        continue
+        return QtGui, QtCore
+    QtGui = QtCore = None
+    return None, None
+
+def __getattr__(name):
+    """Resolve the lazily imported module attributes (PEP 562)."""
+    if name == "mel":
+        return _get_mel()
+    if name in ("QtGui", "QtCore"):
+        _ensure_qt()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 ################################################################################
 # UTILITY FUNCTIONS (LEGACY & HELPER FUNCTIONS)
 ################################################################################
 
+@lru_cache(maxsize=1)
 def get_frame_rate():
-    """Get the current frame rate in Maya."""
-    rate_str = cmds.currentUnit(q=True, time=True)
-    if rate_str == "game":
-        frame_rate = 15.0
-    elif rate_str == "film":
-        frame_rate = 24.0
-    elif rate_str == "pal":
-        frame_rate = 25.0
-    elif rate_str == "ntsc":
-        frame_rate = 30.0
-    elif rate_str == "show":
-        frame_rate = 48.0
-    elif rate_str == "palf":
-        frame_rate = 50.0
-    elif rate_str == "ntscf":
-        frame_rate = 60.0
-    elif rate_str.endswith("fps"):
-        frame_rate = float(rate_str[:-3])
-    else:
-        raise RuntimeError(f"Unsupported frame rate: {rate_str}")
-    return frame_rate
-
-def parse_filename_tags(filename, camera):
+    """
+    Get the current frame rate in Maya (24 if the time unit is unknown).
+
+    The result is cached; the cache is cleared when the scene's time unit changes.
+    """
+    return utils.get_frame_rate()
+
+@lru_cache(maxsize=1)
+def get_user_name():
+    """Get the login name of the current user, looked up once per session."""
+    user_name = os.getenv("USER") or os.getenv("USERNAME")
+    if not user_name:
+        import getpass
+        user_name = getpass.getuser()
+    return user_name
+
+# Filename tags understood by parse_filename_tags
+_TAG_RE = re.compile(r"\{(scene|camera|date|time|timestamp|user|project)\}")
+# Replaces characters that are not allowed in filenames with underscores
+_INVALID_CHARS = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+
+def parse_filename_tags(filename, camera, scene_name=None):
     """
     Replace known tags in the filename with dynamic values.
     For example, {scene} is replaced with the current scene name and {camera}
-    with the camera’s short name.
+    with the camera’s short name. {date}, {time}, {timestamp}, {user} and
+    {project} are also supported. Characters that are invalid in filenames
+    are replaced with underscores.
+
+    scene_name may be passed by callers that already know the short scene name
+    so {scene} does not query the scene again.
     """
-    scene = os.path.splitext(os.path.basename(cmds.file(q=True, sceneName=True) or "untitled"))[0]
-    camera_name = camera.split('|')[-1].split(':')[-1] if camera else "cam"
-    filename = filename.replace("{scene}", scene).replace("{camera}", camera_name)
-    return filename
+    now = []
+
+    def get_now():
+        # {date} and {time} share one timestamp
+        if not now:
+            import datetime
+            now.append(datetime.datetime.now())
+        return now[0]
+
+    tag_values = {
+        "scene": lambda: scene_name or os.path.splitext(os.path.basename(cmds.file(q=True, sceneName=True) or "untitled"))[0],
+        "camera": lambda: camera.rpartition('|')[2].rpartition(':')[2] if camera else "cam",
+        "date": lambda: get_now().strftime("%Y%m%d"),
+        "time": lambda: get_now().strftime("%H%M%S"),
+        "timestamp": lambda: get_now().strftime("%Y%m%d_%H%M%S"),
+        "user": get_user_name,
+        "project": lambda: cmds.workspace(q=True, shortName=True)
+    }
+    # Each tag is resolved at most once, and only if the filename uses it
+    resolved = {}
+
+    def replace_tag(match):
+        tag = match.group(1)
+        if tag not in resolved:
+            resolved[tag] = tag_values[tag]()
+        return resolved[tag]
 
-def configure_output_path(output_dir, filename, format_type, encoder):
+    return _TAG_RE.sub(replace_tag, filename).translate(_INVALID_CHARS)
+
+def configure_output_path(output_dir, filename, format_type, encoder, create_dir=True):
     """
     Construct the full output path using the output directory, filename,
     and file extension determined from format_type and encoder.
+
+    The output directory is created if it does not exist yet, unless
+    create_dir is False.
     """
     ext = format_type if format_type != "Image" else encoder
-    return os.path.join(output_dir, f"{filename}.{ext}")
+    out = Path(output_dir)
+    if create_dir:
+        out.mkdir(parents=True, exist_ok=True)
+    return str(out / f"{filename}.{ext}")
+
+def get_temp_intermediate_format(encoder, quality):
+    """
+    Get the image format Maya writes for frames that ffmpeg will encode.
+
+    Uses the "tempIntermediate" option if set. Otherwise ProRes masters and
+    "Very High" quality get a lossless format, and JPEG is used for the lossy
+    H.264/H.265 encodes, which discard that precision anyway.
+    """
+    preference = utils.load_option_var("tempIntermediate", presets.DEFAULT_TEMP_INTERMEDIATE)
+    if preference in presets.TEMP_INTERMEDIATE_FORMATS:
+        return preference
+    if encoder == "prores" or quality == "Very High":
+        return presets.LOSSLESS_TEMP_INTERMEDIATE
+    return "jpg"
+
+def _build_ffmpeg_settings(encoder, quality, temp_format, fps=None):
+    """Build the encoding settings for utils.start_ffmpeg_pipe/encode_with_ffmpeg."""
+    return {
+        "encoder": encoder,
+        "quality": quality,
+        "preset": utils.load_option_var("h264Preset", presets.DEFAULT_H264_PRESET),
+        "framerate": fps or get_frame_rate(),
+        "hw_encoder": utils.get_hw_encoder(encoder, utils.load_option_var("hwEncoder", presets.DEFAULT_HW_ENCODER)),
+        "input_codec": presets.TEMP_INTERMEDIATE_FORMATS[temp_format],
+        "threads": int(utils.load_option_var("ffmpegThreads", os.cpu_count() or 1))
+    }
+
+def get_temp_base():
+    """
+    Get the directory temporary playblast folders are created in.
+
+    Uses the "tempDirectory" option, then the temp_directory custom location,
+    and returns None (the system temp directory) if neither is set.
+    """
+    temp_base = utils.load_option_var("tempDirectory", "") or presets.CUSTOM_LOCATIONS.get("temp_directory", "")
+    return temp_base or None
+
+def set_temp_dir(temp_base):
+    """Store the directory temporary playblast folders are created in."""
+    utils.save_option_var("tempDirectory", temp_base)
 
 def create_temp_directory():
-    """Create a temporary directory for intermediate files."""
-    temp_dir = tempfile.mkdtemp(prefix="playblast_")
-    return temp_dir
+    """
+    Create a temporary directory for intermediate files.
+
+    An emptied directory from an earlier playblast is reused when one is
+    available. New ones come from mkdtemp, which picks the name and creates the
+    directory atomically, so concurrent playblasts can never share one.
+    """
+    import tempfile
+    temp_base = get_temp_base()
+    base_dir = os.path.abspath(temp_base or tempfile.gettempdir())
+    while _state.temp_dir_pool:
+        temp_dir = _state.temp_dir_pool.pop()
+        if os.path.dirname(temp_dir) == base_dir and os.path.isdir(temp_dir):
+            return temp_dir
+        # Left over from before the temp directory setting changed
+        utils.batch_unlink_tree(temp_dir)
+    if temp_base:
+        os.makedirs(temp_base, exist_ok=True)
+    return tempfile.mkdtemp(prefix="conestoga_playblast_", dir=temp_base)
 
 def clean_temp_directories():
-    """Clean up all temporary directories created during playblast generation."""
-    global _temp_dirs
-    for d in _temp_dirs:
-        if os.path.exists(d):
-            shutil.rmtree(d)
-    _temp_dirs = []
+    """
+    Clean up all temporary directories created during playblast generation.
 
-def get_active_sound_node():
+    The directories are emptied on a background thread so Maya does not stall
+    while a large frame sequence is deleted, then kept for the next playblast.
     """
-    Dummy implementation to get the active sound node.
-    Replace this with your actual logic if sound is to be included.
+    dirs_to_clean = list(_state.temp_dirs)
+    _state.temp_dirs.clear()
+    if dirs_to_clean:
+        _cleanup_executor.submit(_recycle_temp_directories, dirs_to_clean)
+
+def _recycle_temp_directories(dirs):
+    """Empty the given temporary directories and pool them. Runs on the cleanup thread."""
+    for d in dirs:
+        if utils.batch_unlink_tree(d, keep_dir=True):
+            _state.temp_dir_pool.append(d)
+
+def _destroy_temp_directory_pool():
+    """Delete the pooled temporary directories when Maya quits."""
+    while _state.temp_dir_pool:
+        utils.batch_unlink_tree(_state.temp_dir_pool.pop())
+
+def _collect_scene_defaults():
     """
-    return None
+    Query the scene values create_playblast falls back on in a single MEL call.
 
-def show_ui():
-    """Show the Playblast UI."""
-    try:
-        import conestoga_playblast_ui
-        conestoga_playblast_ui.show_playblast_dialog()
-    except Exception as e:
-        cmds.warning(f"Failed to display UI: {str(e)}")
+    Returns:
+        dict: width, height, min_time, max_time, root_directory and scene_name
+            (full scene path, empty for an unsaved scene).
+    """
+    result = _get_mel().eval(
+        '"" + `getAttr defaultResolution.width` + ";" + `getAttr defaultResolution.height`'
+        ' + ";" + `playbackOptions -query -minTime` + ";" + `playbackOptions -query -maxTime`'
+        ' + ";" + `workspace -query -rootDirectory` + ";" + `file -query -sceneName`'
+    )
+    # The scene path is last so a ";" inside it cannot shift the other fields
+    width, height, min_time, max_time, root_directory, scene_name = result.split(";", 5)
+    return {
+        "width": int(width),
+        "height": int(height),
+        "min_time": float(min_time),
+        "max_time": float(max_time),
+        "root_directory": root_directory,
+        "scene_name": scene_name
+    }
+
+@lru_cache(maxsize=1)
+def _get_playback_slider():
+    """Return the name of Maya's time slider control, or None without a UI."""
+    if cmds.about(batch=True):
+        return None
+    return _get_mel().eval("$tmpVar = $gPlayBackSlider")
+
+def get_active_sound_node():
+    """
+    Get the audio node shown on the time slider.
+
+    Returns:
+        str: Name of the audio node, or None if no sound is active.
+    """
+    slider = _get_playback_slider()
+    if not slider:
+        return None
+    return cmds.timeControl(slider, query=True, sound=True) or None
 
 ################################################################################
 # IMPORT PRESETS & UTILS (from external modules)
@@ -148,13 +305,61 @@ except ImportError:
 ################################################################################
 # GLOBAL VARIABLES
 ################################################################################
-_playblast_in_progress = False
-_temp_dirs = []
+@dataclass
+class _PlayblastState:
+    """Mutable module state, kept in one object instead of rebindable globals."""
+    in_progress: bool = False
+    temp_dirs: list = field(default_factory=list)
+    # Emptied temp directories ready for reuse (see create_temp_directory)
+    temp_dir_pool: collections.deque = field(default_factory=collections.deque)
+
+_state = _PlayblastState()
+
+# Waits on ffmpeg encodes that finish in the background (see batch_playblast).
+# The threads only block on ffmpeg processes; batch_playblast limits how many run.
+_encode_executor = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="playblast-encode")
+
+# Deletes temp frame directories off the main thread (see clean_temp_directories)
+_cleanup_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="playblast-cleanup")
+# When Maya quits, let pending cleanups finish, then delete the pooled directories
+# (atexit runs handlers in reverse order of registration)
+atexit.register(_destroy_temp_directory_pool)
+atexit.register(_cleanup_executor.shutdown, wait=True)
+
+def _register_script_jobs():
+    """
+    Create the scriptJobs that keep this module's caches in sync with the scene.
+
+    A reload keeps the module's globals, so the jobs made by the previous
+    import are killed first instead of piling up.
+
+    Returns:
+        list: The scriptJob IDs.
+    """
+    for job_id in globals().get("_script_jobs", []):
+        if cmds.scriptJob(exists=job_id):
+            cmds.scriptJob(kill=job_id, force=True)
+    return [
+        # Keep the cached frame rate in sync with the scene's time unit
+        cmds.scriptJob(event=["timeUnitChanged", get_frame_rate.cache_clear]),
+        cmds.scriptJob(event=["SceneOpened", get_frame_rate.cache_clear]),
+        # Pick up a per-project ffmpeg override when another scene is opened
+        cmds.scriptJob(event=["SceneOpened", utils.invalidate_ffmpeg_cache])
+    ]
+
+_script_jobs = _register_script_jobs()
 
 ################################################################################
 # MAIN PLAYBLAST FUNCTIONS
 ################################################################################
 
+def _quietly(func, *args, **kwargs):
+    """Call func and ignore any error, for restoring scene state on the way out."""
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        pass
+
 def create_playblast(
     camera=None,
     output_dir=None,
@@ -170,10 +375,19 @@ def create_playblast(
     shot_mask=True,
     overscan=False,
     ornaments=False,
-    show_in_viewer=True,  # Updated parameter from working_playblast_v01.py
+    open_in_viewer=True,
     force_overwrite=False,
     custom_viewport_settings=None,
-    shot_mask_settings=None
+    shot_mask_settings=None,
+    ffmpeg_process=None,
+    resolution=None,
+    frame_range=None,
+    encode_futures=None,
+    progress_callback=None,
+    is_cancelled=None,
+    preview=False,
+    _batch_setup=None,
+    show_in_viewer=None
 ):
     """
     Create a playblast with the specified settings.
@@ -193,22 +407,49 @@ def create_playblast(
         shot_mask (bool): Whether to include a shot mask overlay.
         overscan (bool): Enable camera overscan.
         ornaments (bool): Show UI ornaments.
-        show_in_viewer (bool): Open the result in a viewer when done.
+        open_in_viewer (bool): Open the result in a viewer when done.
         force_overwrite (bool): Overwrite existing files if they exist.
         custom_viewport_settings (list): Custom viewport settings (if provided).
         shot_mask_settings (dict): Custom shot mask settings (if provided).
+        ffmpeg_process (subprocess.Popen): Running encoder from utils.start_ffmpeg_pipe()
+            to stream the frames into. It is left running so several playblasts
+            can share one encoder (see batch_playblast).
+        resolution (tuple): (width, height); overrides width and height.
+        frame_range (tuple): (start_frame, end_frame); overrides start_frame and end_frame.
+        encode_futures (list): If given, a streamed encode is left to finish in the
+            background and (future, output_path) is appended here; the future
+            resolves to the ffmpeg error text, or None on success.
+        progress_callback (callable): Called with the finished fraction (0.0-1.0)
+            while frames are streamed to ffmpeg or the sequence is encoded.
+        is_cancelled (callable): Polled between captured chunks and during the
+            encode; when it returns True the playblast stops and returns None.
+        preview (bool): Encode a quick H.264 preview (ultrafast, zerolatency,
+            higher CRF) instead of using the h264Preset option and quality CRF.
+        _batch_setup (dict): Viewport state from _setup_batch_viewport(). The
+            viewport is then already configured and is left for the caller to restore.
+        show_in_viewer (bool): Deprecated name for open_in_viewer.
         
     Returns:
         str: Path to the created playblast file, or None if failed.
     """
-    global _playblast_in_progress, _temp_dirs
-
-    if _playblast_in_progress:
+    if _state.in_progress:
         cmds.warning("A playblast is already in progress")
         return None
 
-    if format_type in presets.MOVIE_FORMATS and not utils.is_ffmpeg_available():
+    if show_in_viewer is not None:
+        open_in_viewer = show_in_viewer
+    if resolution is not None:
+        width, height = resolution
+    if frame_range is not None:
+        start_frame, end_frame = frame_range
+
+    # Checked once; the answer is cached until the FFmpeg path changes
+    ffmpeg_available = format_type in presets.MOVIE_FORMATS and utils.is_ffmpeg_available()
+    if format_type in presets.MOVIE_FORMATS and not ffmpeg_available:
         cmds.warning("FFmpeg is required but not available. Please install FFmpeg or choose Image format.")
+        # Nobody can answer a dialog in batch mode
+        if cmds.about(batch=True):
+            return None
         ffmpeg_path = utils.get_ffmpeg_path()
         if not ffmpeg_path:
             cmds.confirmDialog(
@@ -226,46 +467,64 @@ def create_playblast(
             )
         return None
 
-    _playblast_in_progress = True
-    temp_dir = None
-    original_camera = None
-    viewport_defaults = None
-    image_plane_states = None
-    shot_mask_created = False
+    _state.in_progress = True
+    overlay_path = None
     output_path = None
 
     try:
+        # Looked up once and used for both the default camera and the viewport setup.
+        model_panel = _batch_setup["model_panel"] if _batch_setup else utils.get_valid_model_panel()
+
         # Determine camera selection.
-        if camera is None:
-            panel = utils.get_valid_model_panel()
-            if panel:
-                camera = cmds.modelPanel(panel, query=True, camera=True)
+        if camera is None and model_panel:
+            camera = cmds.modelPanel(model_panel, query=True, camera=True)
         if not camera or not cmds.objExists(camera):
             cmds.warning(f"Invalid camera: {camera}")
             return None
 
+        # Query any scene defaults that are needed in one round trip.
+        if (not output_dir or not filename or start_frame is None or end_frame is None
+                or width is None or height is None):
+            scene_defaults = _collect_scene_defaults()
+            # Shared by the default filename, the {scene} tag and the shot mask overlay
+            scene_short = os.path.splitext(os.path.basename(scene_defaults["scene_name"]))[0] or "untitled"
+        else:
+            scene_defaults = {}
+            scene_short = None
+
         # Setup output directory and filename.
         if not output_dir:
-            output_dir = os.path.join(cmds.workspace(query=True, rootDirectory=True), "movies")
+            output_dir = os.path.join(scene_defaults["root_directory"], "movies")
         if not filename:
-            scene_name = cmds.file(query=True, sceneName=True, shortName=True).split('.')[0] or "untitled"
-            camera_name = camera.split('|')[-1].split(':')[-1]
-            filename = f"{scene_name}_{camera_name}"
-        filename = parse_filename_tags(filename, camera)
+            # Filled in by the same single pass as user supplied tags
+            filename = "{scene}_{camera}"
+        filename = parse_filename_tags(filename, camera, scene_short)
 
         # Determine frame range.
         if start_frame is None:
-            start_frame = int(cmds.playbackOptions(query=True, minTime=True))
+            start_frame = int(scene_defaults["min_time"])
         if end_frame is None:
-            end_frame = int(cmds.playbackOptions(query=True, maxTime=True))
+            end_frame = int(scene_defaults["max_time"])
 
         # Determine resolution settings.
         if width is None or height is None:
-            width = cmds.getAttr("defaultResolution.width")
-            height = cmds.getAttr("defaultResolution.height")
+            width = scene_defaults["width"]
+            height = scene_defaults["height"]
+        fps = get_frame_rate()
 
-        output_path = configure_output_path(output_dir, filename, format_type, encoder)
-        if os.path.exists(output_path) and not force_overwrite:
+        # Within a batch each output directory only needs creating once
+        output_dirs = _batch_setup["output_dirs"] if _batch_setup else set()
+        output_path = configure_output_path(
+            output_dir, filename, format_type, encoder, create_dir=output_dir not in output_dirs
+        )
+        output_dirs.add(output_dir)
+        if ffmpeg_process is None and os.path.exists(output_path) and not force_overwrite and cmds.about(batch=True):
+            # A dialog would wait forever in batch mode, so follow the stored policy
+            if utils.load_option_var("batchOverwritePolicy", "overwrite") == "skip":
+                print(f"Skipping existing playblast: {output_path}")
+                return None
+            force_overwrite = True
+        if ffmpeg_process is None and os.path.exists(output_path) and not force_overwrite:
             result = cmds.confirmDialog(
                 title="File Exists",
                 message=f"The file already exists:\n{output_path}\n\nDo you want to overwrite it?",
@@ -279,15 +538,20 @@ def create_playblast(
                 return None
 
         temp_dir = create_temp_directory()
-        _temp_dirs.append(temp_dir)
+        _state.temp_dirs.append(temp_dir)
 
         # Determine playblast parameters based on FFmpeg encoding.
-        use_ffmpeg = format_type in presets.MOVIE_FORMATS and utils.is_ffmpeg_available()
+        use_ffmpeg = ffmpeg_available
+        capture_quality = 100
         if use_ffmpeg:
-            temp_format = "png"
+            temp_format = get_temp_intermediate_format(encoder, quality)
             playblast_format = "image"
             compression = temp_format
+            if temp_format == "jpg":
+                capture_quality = presets.TEMP_JPEG_QUALITY
             playblast_filename = os.path.join(temp_dir, filename)
+            # Maya writes <playblast_filename>.####.<ext>
+            input_pattern = f"{playblast_filename}.%04d.{temp_format}"
         else:
             if format_type == "Image":
                 playblast_format = "image"
@@ -297,94 +561,168 @@ def create_playblast(
                 compression = None
             playblast_filename = os.path.normpath(output_path)
 
-        # Get the active model panel and store viewport settings.
-        model_panel = utils.get_valid_model_panel()
         if not model_panel:
             cmds.warning("No valid model panel found")
             return None
+        # Store viewport settings, unless a batch has already done that once for
+        # all of its cameras. Everything changed below is put back by the stack.
+        with contextlib.ExitStack() as restore:
+            if not _batch_setup:
+                original_camera = cmds.modelPanel(model_panel, query=True, camera=True)
+                viewport_defaults = utils.get_viewport_defaults(model_panel, camera)
+                # Undone in reverse order of registration when the block exits
+                restore.callback(_quietly, utils.restore_viewport, model_panel, camera, viewport_defaults)
+                restore.callback(_quietly, cmds.lookThru, original_camera)
+            image_plane_states = utils.disable_image_planes(camera)
+            if image_plane_states:
+                restore.callback(_quietly, utils.restore_image_planes, image_plane_states)
 
-        original_camera = cmds.modelPanel(model_panel, query=True, camera=True)
-        viewport_defaults = utils.get_viewport_defaults(model_panel, camera)
-        image_plane_states = utils.disable_image_planes(camera)
-
-        # Setup shot mask if enabled.
-        if shot_mask:
-            settings = presets.CUSTOM_MASK_TEMPLATES.get("Standard", {})
-            if shot_mask_settings:
-                settings.update(shot_mask_settings)
-            user_name = settings.get("userName", os.getenv("USER") or getpass.getuser())
-            mask_data = utils.create_shot_mask(camera, user_name)
-            shot_mask_created = bool(mask_data)
+            # Setup shot mask if enabled.
+            if shot_mask:
+                settings = {**presets.CUSTOM_MASK_TEMPLATES.get("Standard", {}), **(shot_mask_settings or {})}
+                user_name = settings.get("userName") or get_user_name()
+                if use_ffmpeg and settings.get("mode") == "overlay":
+                    # Rendered once and composited by ffmpeg, so nothing is added to the scene.
+                    # The image lives in temp_dir and is removed with it.
+                    scene_name = scene_short or os.path.splitext(
+                        os.path.basename(cmds.file(query=True, sceneName=True) or "untitled"))[0]
+                    overlay_path = utils.create_shot_mask_overlay(
+                        os.path.join(temp_dir, "shot_mask_overlay.png"),
+                        width, height, scene_name, user_name, fps, settings.get("textColor")
+                    )
+                elif _batch_setup:
+                    # Built for the first camera of the batch and moved to each following one
+                    if _batch_setup["mask_data"]:
+                        utils.retarget_shot_mask(_batch_setup["mask_data"], camera)
+                    else:
+                        _batch_setup["mask_data"] = utils.create_shot_mask(camera, user_name)
+                elif utils.create_shot_mask(camera, user_name):
+                    restore.callback(_quietly, utils.remove_shot_mask)
 
-        try:
             # Look through the target camera and configure the viewport.
-            cmds.lookThru(camera)
-            utils.set_final_viewport(model_panel, camera, viewport_preset)
+            # Redraws are suspended so each change doesn't repaint the viewport.
+            cmds.refresh(suspend=True)
+            try:
+                cmds.lookThru(camera)
+                if not _batch_setup:
+                    utils.set_final_viewport(model_panel, camera, viewport_preset)
+            finally:
+                cmds.refresh(suspend=False)
+
+            # Evaluate the scene in parallel while capturing.
+            if not _batch_setup and utils.load_option_var("useParallelEM", True):
+                previous_em_mode = cmds.evaluationManager(query=True, mode=True)[0]
+                if previous_em_mode != "parallel":
+                    cmds.evaluationManager(mode="parallel")
+                    restore.callback(_quietly, cmds.evaluationManager, mode=previous_em_mode)
+
             print(f"Creating playblast: {playblast_filename}")
-            cmds.playblast(
-                filename=playblast_filename,
-                forceOverwrite=True,
-                format=playblast_format,
-                compression=compression,
-                quality=100,
-                width=width,
-                height=height,
-                startTime=start_frame,
-                endTime=end_frame,
-                viewer=False,
-                showOrnaments=ornaments,
-                offScreen=not ornaments,
-                percent=100,
-                clearCache=True
-            )
-            # If using FFmpeg, perform encoding.
+            playblast_kwargs = {
+                "filename": playblast_filename,
+                "forceOverwrite": True,
+                "format": playblast_format,
+                "compression": compression,
+                "quality": capture_quality,
+                "width": width,
+                "height": height,
+                "viewer": False,
+                "showOrnaments": ornaments,
+                "offScreen": not ornaments,
+                "percent": 100,
+                "clearCache": True
+            }
             if use_ffmpeg:
-                input_pattern = os.path.join(temp_dir, f"{filename}.%04d.{temp_format}")
-                print(f"Encoding with ffmpeg: {input_pattern} -> {output_path}")
-                ffmpeg_settings = {
-                    "encoder": encoder,
-                    "quality": quality,
-                    "preset": utils.load_option_var("h264Preset", presets.DEFAULT_H264_PRESET),
-                    "framerate": get_frame_rate()
-                }
-                sound_node = get_active_sound_node()
+                print(f"Encoding with ffmpeg: {playblast_filename} -> {output_path}")
+                ffmpeg_settings = _build_ffmpeg_settings(encoder, quality, temp_format, fps)
+                if preview:
+                    # A throwaway preview, so favor encode speed over size and quality
+                    ffmpeg_settings.update(
+                        preset="ultrafast",
+                        tune="zerolatency",
+                        bframes=0,
+                        crf=presets.H264_PREVIEW_QUALITIES.get(quality, presets.H264_PREVIEW_QUALITIES[presets.DEFAULT_H264_QUALITY])
+                    )
+                if overlay_path:
+                    ffmpeg_settings["overlay_path"] = overlay_path
+                # The timeline sound cannot change during a batch, so it is looked up once there
+                sound_node = _batch_setup["sound_node"] if _batch_setup else get_active_sound_node()
                 if sound_node:
                     audio_path = cmds.getAttr(f"{sound_node}.filename")
                     audio_offset = cmds.getAttr(f"{sound_node}.offset")
                     if os.path.exists(audio_path):
                         ffmpeg_settings["audio_path"] = audio_path
-                        ffmpeg_settings["audio_offset"] = audio_offset / get_frame_rate()
-                if not utils.encode_with_ffmpeg(input_pattern, output_path, ffmpeg_settings):
-                    cmds.warning("ffmpeg encoding failed")
-            # Updated call: use show_in_viewer (from working_playblast_v01.py) to open the result.
-            if show_in_viewer and os.path.exists(output_path):
+                        # The offset is the frame the sound starts on; the movie starts at start_frame
+                        ffmpeg_settings["audio_offset"] = (audio_offset - start_frame) / fps
+
+                # Start the encoder before capturing anything, then stream each finished
+                # chunk to it so it works on one chunk while Maya captures the next
+                if ffmpeg_process:
+                    encoder_process = ffmpeg_process
+                else:
+                    try:
+                        encoder_process = utils.start_ffmpeg_pipe(output_path, ffmpeg_settings)
+                    except OSError as e:
+                        cmds.warning(f"Could not start ffmpeg, encoding after capture instead: {e}")
+                        encoder_process = None
+
+                if encoder_process:
+                    streamed = True
+                    # Only one chunk of frames is ever on disk; smaller chunks mean less
+                    # temp space, larger ones fewer cmds.playblast calls
+                    chunk_size = max(1, int(utils.load_option_var("pipelineChunkFrames", presets.PIPELINE_CHUNK_FRAMES)))
+                    first_frame = int(start_frame)
+                    # Maya numbers the files by scene frame, so the paths are known up
+                    # front and the temp directory never has to be listed
+                    frame_paths = [input_pattern % frame for frame in range(first_frame, int(end_frame) + 1)]
+                    for offset in range(0, len(frame_paths), chunk_size):
+                        chunk_paths = frame_paths[offset:offset + chunk_size]
+                        chunk_start = first_frame + offset
+                        cmds.playblast(startTime=chunk_start, endTime=chunk_start + len(chunk_paths) - 1, **playblast_kwargs)
+                        if offset == 0 and not os.path.exists(chunk_paths[0]):
+                            cmds.warning(f"Captured frames not found at {input_pattern}")
+                            streamed = False
+                            break
+                        if not utils.feed_ffmpeg_pipe(encoder_process, chunk_paths, delete=True):
+                            streamed = False
+                            break
+                        if progress_callback:
+                            progress_callback((offset + len(chunk_paths)) / len(frame_paths))
+                        if is_cancelled and is_cancelled():
+                            # A shared encoder is stopped by its owner
+                            if ffmpeg_process is None:
+                                utils.abort_ffmpeg_pipe(encoder_process, output_path)
+                            cmds.warning("Playblast cancelled")
+                            return None
+                    # A shared encoder is finished by its owner
+                    if ffmpeg_process is None and encode_futures is not None and streamed:
+                        # Every frame is already in the pipe, so the caller can move on
+                        # while ffmpeg finishes the encode
+                        future = _encode_executor.submit(utils.wait_ffmpeg_pipe, encoder_process)
+                        encode_futures.append((future, output_path))
+                    elif ffmpeg_process is None and not utils.finish_ffmpeg_pipe(encoder_process):
+                        streamed = False
+                    if not streamed:
+                        cmds.warning("ffmpeg encoding failed")
+                else:
+                    # Serial fallback: capture everything, then encode the sequence
+                    cmds.playblast(startTime=start_frame, endTime=end_frame, **playblast_kwargs)
+                    ffmpeg_settings["start_number"] = int(start_frame)
+                    if not utils.encode_with_ffmpeg(
+                        input_pattern, output_path, ffmpeg_settings,
+                        progress_callback, int(end_frame) - int(start_frame) + 1, is_cancelled
+                    ):
+                        if is_cancelled and is_cancelled():
+                            return None
+                        cmds.warning("ffmpeg encoding failed")
+            else:
+                cmds.playblast(startTime=start_frame, endTime=end_frame, **playblast_kwargs)
+            if open_in_viewer and ffmpeg_process is None and os.path.exists(output_path):
                 utils.show_in_viewer(output_path)
             print(f"Playblast completed: {output_path}")
             cmds.headsUpMessage(f"Playblast saved to: {output_path}", time=3.0)
             return output_path
-        finally:
-            # Restore original camera and viewport settings.
-            if original_camera:
-                try:
-                    cmds.lookThru(original_camera)
-                except Exception:
-                    pass
-            if model_panel and viewport_defaults:
-                try:
-                    utils.restore_viewport(model_panel, camera, viewport_defaults)
-                except Exception:
-                    pass
-            if image_plane_states:
-                try:
-                    utils.restore_image_planes(image_plane_states)
-                except Exception:
-                    pass
-            if shot_mask_created:
-                try:
-                    utils.remove_shot_mask()
-                except Exception:
-                    pass
     except Exception as e:
+        import traceback
         cmds.warning(f"Playblast failed: {str(e)}")
         traceback.print_exc()
         return None
@@ -393,13 +731,61 @@ def create_playblast(
             clean_temp_directories()
         except Exception:
             pass
-        _playblast_in_progress = False
+        _state.in_progress = False
+
+def _setup_batch_viewport(camera, viewport_preset="Standard"):
+    """
+    Store and configure the viewport once for a batch of playblasts.
+
+    Pass the result to create_playblast as _batch_setup for every camera, then
+    to _restore_batch_viewport() after the last one.
+
+    Returns:
+        dict: model_panel, original_camera, viewport_defaults, previous_em_mode,
+            sound_node and mask_data (filled by the first camera that needs a
+            shot mask), or None if there is no valid model panel.
+    """
+    model_panel = utils.get_valid_model_panel()
+    if not model_panel:
+        return None
+    batch_setup = {
+        "model_panel": model_panel,
+        "original_camera": cmds.modelPanel(model_panel, query=True, camera=True),
+        "viewport_defaults": utils.get_viewport_defaults(model_panel, camera),
+        "previous_em_mode": None,
+        "sound_node": get_active_sound_node(),
+        "mask_data": None,
+        "output_dirs": set()
+    }
+    cmds.refresh(suspend=True)
+    try:
+        utils.set_final_viewport(model_panel, camera, viewport_preset)
+    finally:
+        cmds.refresh(suspend=False)
+    if utils.load_option_var("useParallelEM", True):
+        em_mode = cmds.evaluationManager(query=True, mode=True)[0]
+        if em_mode != "parallel":
+            batch_setup["previous_em_mode"] = em_mode
+            cmds.evaluationManager(mode="parallel")
+    return batch_setup
+
+def _restore_batch_viewport(batch_setup):
+    """Undo _setup_batch_viewport() and remove the batch's shot mask."""
+    if batch_setup["previous_em_mode"]:
+        _quietly(cmds.evaluationManager, mode=batch_setup["previous_em_mode"])
+    if batch_setup["original_camera"]:
+        _quietly(cmds.lookThru, batch_setup["original_camera"])
+    if batch_setup["viewport_defaults"]:
+        _quietly(utils.restore_viewport, batch_setup["model_panel"], None, batch_setup["viewport_defaults"])
+    if batch_setup["mask_data"]:
+        _quietly(utils.remove_shot_mask)
 
 def batch_playblast(
     cameras,
     output_dir=None,
     filename=None,
-    settings=None
+    settings=None,
+    combine=None
 ):
     """
     Create playblasts for multiple cameras.
@@ -409,6 +795,9 @@ def batch_playblast(
         output_dir (str): Output directory path.
         filename (str): Output filename template.
         settings (dict): Additional playblast settings.
+        combine (bool): Encode all cameras back to back into a single movie
+            with one ffmpeg process, instead of one movie per camera.
+            None uses the "batchCombineCameras" option (off by default).
         
     Returns:
         list: Paths to the created playblast files.
@@ -418,6 +807,52 @@ def batch_playblast(
         return []
     if settings is None:
         settings = {}
+    if combine is None:
+        combine = bool(utils.load_option_var("batchCombineCameras", False))
+
+    # Resolve the scene defaults once rather than once per camera
+    scene_defaults = _collect_scene_defaults()
+    settings = dict(settings)
+    # Settings saved before the open_in_viewer rename
+    if "show_in_viewer" in settings:
+        settings.setdefault("open_in_viewer", settings.pop("show_in_viewer"))
+    if not output_dir and not settings.get("output_dir"):
+        output_dir = os.path.join(scene_defaults["root_directory"], "movies")
+    if settings.get("start_frame") is None:
+        settings["start_frame"] = int(scene_defaults["min_time"])
+    if settings.get("end_frame") is None:
+        settings["end_frame"] = int(scene_defaults["max_time"])
+    if settings.get("width") is None or settings.get("height") is None:
+        settings["width"] = scene_defaults["width"]
+        settings["height"] = scene_defaults["height"]
+
+    combined_path = None
+    if combine:
+        format_type = settings.get("format_type", presets.DEFAULT_OUTPUT_FORMAT)
+        encoder = settings.get("encoder", presets.DEFAULT_ENCODER)
+        quality = settings.get("quality", presets.DEFAULT_H264_QUALITY)
+        mask_settings = {**presets.CUSTOM_MASK_TEMPLATES.get("Standard", {}), **(settings.get("shot_mask_settings") or {})}
+        if format_type not in presets.MOVIE_FORMATS or not utils.is_ffmpeg_available():
+            cmds.warning("Combining cameras needs ffmpeg and a movie format. Writing one file per camera.")
+        elif settings.get("shot_mask", True) and mask_settings.get("mode") == "overlay":
+            # The overlay is composited by each camera's own encoder, which a shared pipe skips
+            cmds.warning("Combining cameras does not support the overlay shot mask. Writing one file per camera.")
+        elif get_active_sound_node():
+            # The timeline sound matches one camera's frame range, not the cameras back to back
+            cmds.warning("Combining cameras does not support timeline sound. Writing one file per camera.")
+        else:
+            combined_path = configure_output_path(
+                output_dir or settings["output_dir"],
+                parse_filename_tags(filename or "{scene}_cameras", None),
+                format_type,
+                encoder
+            )
+            ffmpeg_settings = _build_ffmpeg_settings(encoder, quality, get_temp_intermediate_format(encoder, quality))
+
+    # The viewport preset, evaluation mode and shot mask are the same for every
+    # camera, so they are set up once here instead of inside each playblast
+    batch_setup = _setup_batch_viewport(cameras[0], settings.get("viewport_preset", "Standard"))
+
     progress_window = cmds.progressWindow(
         title="Batch Playblast",
         progress=0,
@@ -426,26 +861,103 @@ def batch_playblast(
     )
     results = []
     total_cameras = len(cameras)
+    encode_queue_size = max(1, int(utils.load_option_var("encodeQueueSize", presets.DEFAULT_ENCODE_QUEUE_SIZE)))
+    if filename is None:
+        filename = settings.get("filename")
+    has_camera_tag = bool(filename) and "{camera}" in filename
+    ffmpeg_process = None
+    # Set once every camera has gone through; anything else discards the combined movie
+    completed = False
+    camera_failed = False
     try:
+        # One encoder for every camera saves a process spawn and codec setup per camera
+        if combined_path:
+            try:
+                ffmpeg_process = utils.start_ffmpeg_pipe(combined_path, ffmpeg_settings)
+            except OSError as e:
+                cmds.warning(f"Could not start ffmpeg: {str(e)}")
+            if not ffmpeg_process:
+                cmds.warning("Writing one file per camera instead of a combined movie.")
+                combined_path = None
+        # Each camera's encode finishes in the background while the next one is captured
+        encode_futures = None if ffmpeg_process else []
+
+        # Arguments shared by every camera, built once; the per-camera values are
+        # passed next to them and must not also be in here
+        base_kwargs = {
+            key: value for key, value in settings.items()
+            if key not in ("camera", "filename", "progress_callback")
+        }
+        base_kwargs["output_dir"] = output_dir or settings.get("output_dir")
+        base_kwargs["_batch_setup"] = batch_setup
+        base_kwargs["is_cancelled"] = lambda: cmds.progressWindow(query=True, isCancelled=True)
+        if ffmpeg_process:
+            base_kwargs["ffmpeg_process"] = ffmpeg_process
+            base_kwargs["open_in_viewer"] = False
+        else:
+            base_kwargs["encode_futures"] = encode_futures
+
         for i, cam in enumerate(cameras):
             if cmds.progressWindow(query=True, isCancelled=True):
                 break
+            if encode_futures:
+                # Hold the next capture until an encoder slot is free
+                running = [future for future, _ in encode_futures if not future.done()]
+                if len(running) >= encode_queue_size:
+                    cmds.progressWindow(edit=True, status="Waiting for an encode to finish...")
+                    concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
             progress = int((i / total_cameras) * 100)
             cmds.progressWindow(edit=True, progress=progress, status=f"Processing camera: {cam}")
             try:
-                cam_settings = settings.copy()
-                cam_settings['camera'] = cam
-                if filename and "{camera}" not in filename:
-                    cam_settings['filename'] = f"{filename}_{cam}"
-                else:
-                    cam_settings['filename'] = filename
-                result = create_playblast(output_dir=output_dir, **cam_settings)
-                if result:
+                encodes_before = len(encode_futures or [])
+                result = create_playblast(
+                    camera=cam,
+                    filename=f"{filename}_{cam}" if filename and not has_camera_tag else filename,
+                    # Move the bar through this camera's share of the batch
+                    progress_callback=lambda fraction, i=i: cmds.progressWindow(
+                        edit=True, progress=int((i + fraction) / total_cameras * 100)
+                    ),
+                    **base_kwargs
+                )
+                # Background encodes are collected below, once they have finished
+                if result and len(encode_futures or []) == encodes_before:
                     results.append(result)
+                elif not result and ffmpeg_process:
+                    # None also means cancelled, which the loop handles itself
+                    camera_failed = not cmds.progressWindow(query=True, isCancelled=True)
             except Exception as e:
                 cmds.warning(f"Failed to create playblast for camera {cam}: {str(e)}")
+                camera_failed = bool(ffmpeg_process)
+            if camera_failed:
+                # The combined movie would be missing this camera's segment
+                cmds.warning("A camera failed, so the combined movie is discarded.")
+                break
+
+        if encode_futures:
+            cmds.progressWindow(edit=True, progress=100, status="Finishing encodes...")
+            pending_paths = dict(encode_futures)
+            for future in concurrent.futures.as_completed(pending_paths):
+                error = future.result()
+                if error:
+                    cmds.warning(f"ffmpeg error for {pending_paths[future]}: {error}")
+                else:
+                    results.append(pending_paths[future])
+        completed = not camera_failed and not cmds.progressWindow(query=True, isCancelled=True)
     finally:
         cmds.progressWindow(endProgress=1)
+        if batch_setup:
+            _restore_batch_viewport(batch_setup)
+        if ffmpeg_process:
+            if not completed:
+                # Cancelled or failed part way: stop ffmpeg and delete the partial movie
+                utils.abort_ffmpeg_pipe(ffmpeg_process, combined_path)
+                results = []
+            elif utils.finish_ffmpeg_pipe(ffmpeg_process) and results:
+                results = [combined_path]
+            else:
+                cmds.warning("ffmpeg encoding failed")
+                _quietly(os.remove, combined_path)
+                results = []
     return results
 
 def show_ui():
@@ -453,6 +965,7 @@ def show_ui():
     Display the main user interface for the Conestoga Playblast Tool.
     """
     try:
+        _ensure_qt()
         import conestoga_playblast_ui
         conestoga_playblast_ui.show_playblast_dialog()
     except Exception as e:
@@ -464,7 +977,39 @@ def show_ui():
 # processing of scenes, plugin command definitions, etc.)
 ################################################################################
 
-def batch_playblast_scenes(scene_files, settings=None, camera=None):
+def _get_scene_settings(scene_file, settings, camera):
+    """Build the create_playblast arguments for one scene in a batch."""
+    scene_settings = settings.copy()
+    scene_settings['filename'] = os.path.splitext(os.path.basename(scene_file))[0]
+    if camera:
+        scene_settings['camera'] = camera
+    return scene_settings
+
+def _filter_up_to_date_scenes(scene_files, settings):
+    """
+    Drop scenes whose playblast already exists and is newer than the scene.
+
+    Returns:
+        list: Scene files that still need a playblast.
+    """
+    output_dir = settings.get("output_dir") or os.path.join(cmds.workspace(query=True, rootDirectory=True), "movies")
+    format_type = settings.get("format_type", "mp4")
+    encoder = settings.get("encoder", "h264")
+    pending = []
+    for scene_file in scene_files:
+        output_path = configure_output_path(
+            output_dir, os.path.splitext(os.path.basename(scene_file))[0], format_type, encoder,
+            create_dir=False
+        )
+        try:
+            if os.path.getmtime(output_path) >= os.path.getmtime(scene_file):
+                continue
+        except OSError:
+            pass
+        pending.append(scene_file)
+    return pending
+
+def batch_playblast_scenes(scene_files, settings=None, camera=None, skip_up_to_date=True):
     """
     Open and playblast multiple Maya scene files.
     
@@ -472,6 +1017,7 @@ def batch_playblast_scenes(scene_files, settings=None, camera=None):
         scene_files (list): List of Maya scene file paths.
         settings (dict): Playblast settings.
         camera (str): Camera to use (None = use active camera).
+        skip_up_to_date (bool): Skip scenes whose playblast is newer than the scene file.
         
     Returns:
         list: Paths to created playblast files.
@@ -481,6 +1027,17 @@ def batch_playblast_scenes(scene_files, settings=None, camera=None):
         return []
     if settings is None:
         settings = {}
+
+    # Checking the outputs first avoids opening scenes that have not changed
+    if skip_up_to_date:
+        pending = _filter_up_to_date_scenes(scene_files, settings)
+        skipped = len(scene_files) - len(pending)
+        if skipped:
+            print(f"Skipping {skipped} scene(s) with up-to-date playblasts")
+        scene_files = pending
+        if not scene_files:
+            return []
+
     current_scene = cmds.file(query=True, sceneName=True)
     current_modified = cmds.file(query=True, modified=True)
     progress_window = cmds.progressWindow(
@@ -501,11 +1058,7 @@ def batch_playblast_scenes(scene_files, settings=None, camera=None):
             try:
                 cmds.file(scene_file, open=True, force=True)
                 cmds.refresh()
-                scene_settings = settings.copy()
-                scene_settings['filename'] = os.path.splitext(os.path.basename(scene_file))[0]
-                if camera:
-                    scene_settings['camera'] = camera
-                result = create_playblast(**scene_settings)
+                result = create_playblast(**_get_scene_settings(scene_file, settings, camera))
                 if result:
                     results.append(result)
             except Exception as e:
@@ -7,9 +7,9 @@ It adds menu items to Maya's main menu and can be run automatically at Maya star
 
 import sys
 import os
+import functools
 
 import maya.cmds as cmds
-import maya.mel as mel
 import maya.utils as utils
 
 # Add script directory to path if needed
@@ -17,33 +17,33 @@ script_dir = os.path.dirname(os.path.abspath(__file__))
 if script_dir not in sys.path:
     sys.path.append(script_dir)
 
-import conestoga_playblast_presets as presets
+# maya.mel and the presets module are imported by the functions that use them,
+# so importing this module from userSetup.py stays cheap at Maya startup.
 
 MENU_NAME = "ConestoGameDev"
 MENU_LABEL = "Conestoga GameDev"
 MENU_PARENT = "MayaWindow"
 
-def find_icon(icon_name):
+def _scan_icon_dirs(paths):
+    """Map file names to full paths for the given directories; earlier ones win."""
+    index = {}
+    for path in paths:
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    index.setdefault(entry.name, entry.path)
+        except OSError:
+            continue
+    return index
+
+@functools.lru_cache(maxsize=1)
+def _icon_index():
     """
-    Dynamically locate an icon file in various possible locations.
-    
-    Args:
-        icon_name (str): Base name of the icon (e.g., 'playblast.png')
-        
+    List the icon directories once per session.
+
     Returns:
-        str: Full path to the icon if found, or the base name if not found
+        tuple: (tool_icons, maya_icons) dicts of file name to full path.
     """
-    # Look in the tool's directory first
-    tool_icon_path = os.path.join(script_dir, icon_name)
-    if os.path.exists(tool_icon_path):
-        return tool_icon_path
-        
-    # Look for icons with the tool name prefix
-    tool_specific_icon = os.path.join(script_dir, f"conestoga_{icon_name}")
-    if os.path.exists(tool_specific_icon):
-        return tool_specific_icon
-    
-    # Try looking in standard Maya icon paths
     maya_icon_paths = []
     
     # Add MAYA_ICON_PATH if it exists
@@ -55,17 +55,38 @@ def find_icon(icon_name):
     if maya_location:
         maya_icon_paths.append(os.path.join(maya_location, 'icons'))
     
-    # Check each path for the icon
-    for path in maya_icon_paths:
-        full_path = os.path.join(path, icon_name)
-        if os.path.exists(full_path):
-            return full_path
+    return _scan_icon_dirs([script_dir]), _scan_icon_dirs(maya_icon_paths)
+
+def find_icon(icon_name):
+    """
+    Dynamically locate an icon file in various possible locations.
+    
+    The directories are scanned on the first call; later calls are lookups.
+    
+    Args:
+        icon_name (str): Base name of the icon (e.g., 'playblast.png')
+        
+    Returns:
+        str: Full path to the icon if found, or the base name if not found
+    """
+    tool_icons, maya_icons = _icon_index()
+    
+    # Look in the tool's directory first, then for icons with the tool name prefix
+    for name in (icon_name, f"conestoga_{icon_name}"):
+        if name in tool_icons:
+            return tool_icons[name]
+    
+    # Try looking in standard Maya icon paths
+    if icon_name in maya_icons:
+        return maya_icons[icon_name]
     
     # If not found, just return the icon name for Maya to use its default search
     return icon_name
 
 def create_menus():
     """Create the Conestoga GameDev menu in Maya."""
+    import conestoga_playblast_presets as presets
+
     # Remove existing menu if it exists
     if cmds.menu(MENU_NAME, exists=True):
         cmds.deleteUI(MENU_NAME)
@@ -127,6 +148,9 @@ def create_menus():
 
 def create_shelf_buttons():
     """Create shelf buttons for the playblast tool."""
+    import maya.mel as mel
+    import conestoga_playblast_presets as presets
+
     try:
         # Get the gShelfTopLevel global variable
         gShelfTopLevel = mel.eval('$temp=$gShelfTopLevel')
@@ -198,6 +222,8 @@ def create_shelf_buttons():
 
 def initialize():
     """Initialize the menu integration."""
+    import conestoga_playblast_presets as presets
+
     # Create menus
     create_menus()
     
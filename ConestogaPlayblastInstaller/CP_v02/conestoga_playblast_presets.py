@@ -4,6 +4,7 @@ This module contains constants, default settings, and presets for the playblast
 """
 
 import os
+import types
 import maya.cmds as cmds
 
 # Tool Information
@@ -43,6 +44,14 @@ H264_QUALITIES = {
     "Low": 26
 }
 
+# CRF values for quick previews (create_playblast(preview=True))
+H264_PREVIEW_QUALITIES = {
+    "Very High": 18,
+    "High": 23,
+    "Medium": 28,
+    "Low": 32
+}
+
 H264_PRESETS = [
     "veryslow",
     "slow",
@@ -52,6 +61,41 @@ H264_PRESETS = [
     "ultrafast"
 ]
 
+# Intermediate image formats for ffmpeg encodes, with the ffmpeg decoder for each.
+# JPEG is much cheaper for Maya to write than PNG. Frames are streamed through
+# image2pipe, so only formats ffmpeg has a parser for can be listed (not TGA).
+TEMP_INTERMEDIATE_FORMATS = {
+    "jpg": "mjpeg",
+    "png": "png"
+}
+TEMP_INTERMEDIATE_PREFERENCES = ["auto"] + list(TEMP_INTERMEDIATE_FORMATS)
+DEFAULT_TEMP_INTERMEDIATE = "auto"
+# Lossless intermediate used by "auto". It has to be a format ffmpeg can split
+# out of an image2pipe stream, which rules out TGA.
+LOSSLESS_TEMP_INTERMEDIATE = "png"
+TEMP_JPEG_QUALITY = 95
+
+# Frames captured per cmds.playblast call when streaming to ffmpeg, so the
+# encoder works on one chunk while Maya captures the next
+PIPELINE_CHUNK_FRAMES = 24
+
+# Camera encodes a batch lets finish in the background at once. Consumer
+# NVIDIA cards only allow a few NVENC sessions, so keep this small.
+DEFAULT_ENCODE_QUEUE_SIZE = 2
+
+# Hardware encoder families, in the order they are tried for "auto"
+HW_ENCODER_FAMILIES = ["nvenc", "amf", "qsv", "videotoolbox"]
+HW_ENCODER_PREFERENCES = ["auto", "off"] + HW_ENCODER_FAMILIES
+DEFAULT_HW_ENCODER = "auto"
+
+# Constant-quality values used by the hardware encoders
+HW_ENCODER_QUALITIES = {
+    "Very High": 19,
+    "High": 23,
+    "Medium": 28,
+    "Low": 32
+}
+
 PRORES_PROFILES = {
     "ProRes 422 Proxy": 0,
     "ProRes 422 LT": 1,
@@ -159,6 +203,10 @@ CUSTOM_MASK_TEMPLATES = {
         "opacity": 0.9
     }
 }
+# Read-only, so overrides are merged into a copy instead of changing the templates
+CUSTOM_MASK_TEMPLATES = types.MappingProxyType(
+    {name: types.MappingProxyType(template) for name, template in CUSTOM_MASK_TEMPLATES.items()}
+)
 
 # Filename Tag Patterns
 TAG_PATTERNS = {
@@ -170,6 +218,20 @@ TAG_PATTERNS = {
     "username": lambda: os.environ.get("USER", os.environ.get("USERNAME", "user"))
 }
 
+# Frames per second for Maya's named time units; "<n>fps" units are parsed
+FRAME_RATES = {
+    "game": 15.0,
+    "film": 24.0,
+    "pal": 25.0,
+    "ntsc": 30.0,
+    "show": 48.0,
+    "palf": 50.0,
+    "ntscf": 60.0
+}
+
+# Prefix for the tool's Maya optionVars
+OPTION_VAR_PREFIX = "conestogaPlayblast_"
+
 # Custom locations for integrations
 CUSTOM_LOCATIONS = {
     "ffmpeg_path": "",
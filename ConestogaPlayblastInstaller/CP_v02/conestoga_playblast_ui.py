@@ -4,6 +4,7 @@ Enhanced for Conestoga College.
 """
 
 import os
+import re
 import sys
 import time
 import tempfile
@@ -11,10 +12,43 @@ import datetime
 import maya.cmds as cmds
 import maya.mel as mel
 import maya.OpenMayaUI as omui
+import maya.api.OpenMaya as om
+import maya.utils
 from PySide6 import QtWidgets, QtCore, QtGui
-from shiboken6 import wrapInstance
+from shiboken6 import wrapInstance, isValid
 import traceback
 
+# Tags understood by parse_shot_mask_text
+_MASK_TAG_RE = re.compile(r"\{(scene|camera|counter|fps|date|username)\}")
+
+# Scene values read by _query_scene_values: (key, MEL query)
+_SCENE_VALUE_QUERIES = (
+    ("width", "getAttr defaultResolution.width"),
+    ("height", "getAttr defaultResolution.height"),
+    ("min_time", "playbackOptions -q -minTime"),
+    ("max_time", "playbackOptions -q -maxTime"),
+    ("animation_start", "playbackOptions -q -animationStartTime"),
+    ("animation_end", "playbackOptions -q -animationEndTime"),
+    ("render_start", "getAttr defaultRenderGlobals.startFrame"),
+    ("render_end", "getAttr defaultRenderGlobals.endFrame"),
+)
+# Frame range presets and their (start, end) keys in the scene values
+_FRAME_RANGE_VALUE_KEYS = {
+    "Playback": ("min_time", "max_time"),
+    "Animation": ("animation_start", "animation_end"),
+    "Render": ("render_start", "render_end"),
+}
+
+def _query_scene_values():
+    """
+    Read the resolution and frame range values the dialog shows in one MEL call.
+
+    Returns:
+        dict: Values keyed as in _SCENE_VALUE_QUERIES.
+    """
+    result = mel.eval('"" + ' + ' + ";" + '.join(f"`{query}`" for _, query in _SCENE_VALUE_QUERIES))
+    return {key: float(value) for (key, _), value in zip(_SCENE_VALUE_QUERIES, result.split(";"))}
+
 # --- New Native Widget Implementations ---
 
 class LineEditWithTags(QtWidgets.QLineEdit):
@@ -23,34 +57,34 @@ class LineEditWithTags(QtWidgets.QLineEdit):
     TYPE_PLAYBLAST_OUTPUT_FILENAME = 2
     TYPE_SHOT_MASK_LABEL = 3
 
+    # Tags offered in the "Insert Tag" submenu for each field type
+    _TAGS_BY_TYPE = {
+        TYPE_PLAYBLAST_OUTPUT_PATH: ("{project}", "{temp}"),
+        TYPE_PLAYBLAST_OUTPUT_FILENAME: ("{scene}", "{camera}", "{timestamp}", "{date}"),
+        TYPE_SHOT_MASK_LABEL: ("{scene}", "{camera}", "{counter}", "{fps}", "{date}", "{username}"),
+    }
+
     def __init__(self, type_val, parent=None):
         super(LineEditWithTags, self).__init__(parent)
         self.type_val = type_val
         self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
 
+    @QtCore.Slot(QtCore.QPoint)
     def show_context_menu(self, pos):
         menu = self.createStandardContextMenu()
         menu.addSeparator()
         tag_menu = QtWidgets.QMenu("Insert Tag", menu)
-        if self.type_val == self.TYPE_PLAYBLAST_OUTPUT_PATH:
-            tag_menu.addAction("{project}").triggered.connect(lambda: self.insert_tag("{project}"))
-            tag_menu.addAction("{temp}").triggered.connect(lambda: self.insert_tag("{temp}"))
-        elif self.type_val == self.TYPE_PLAYBLAST_OUTPUT_FILENAME:
-            tag_menu.addAction("{scene}").triggered.connect(lambda: self.insert_tag("{scene}"))
-            tag_menu.addAction("{camera}").triggered.connect(lambda: self.insert_tag("{camera}"))
-            tag_menu.addAction("{timestamp}").triggered.connect(lambda: self.insert_tag("{timestamp}"))
-            tag_menu.addAction("{date}").triggered.connect(lambda: self.insert_tag("{date}"))
-        elif self.type_val == self.TYPE_SHOT_MASK_LABEL:
-            tag_menu.addAction("{scene}").triggered.connect(lambda: self.insert_tag("{scene}"))
-            tag_menu.addAction("{camera}").triggered.connect(lambda: self.insert_tag("{camera}"))
-            tag_menu.addAction("{counter}").triggered.connect(lambda: self.insert_tag("{counter}"))
-            tag_menu.addAction("{fps}").triggered.connect(lambda: self.insert_tag("{fps}"))
-            tag_menu.addAction("{date}").triggered.connect(lambda: self.insert_tag("{date}"))
-            tag_menu.addAction("{username}").triggered.connect(lambda: self.insert_tag("{username}"))
+        for tag in self._TAGS_BY_TYPE.get(self.type_val, ()):
+            tag_menu.addAction(tag).setData(tag)
+        tag_menu.triggered.connect(self._on_tag_triggered)
         menu.addMenu(tag_menu)
         menu.exec_(self.mapToGlobal(pos))
 
+    @QtCore.Slot(QtGui.QAction)
+    def _on_tag_triggered(self, action):
+        self.insert_tag(action.data())
+
     def insert_tag(self, tag):
         self.insert(tag)
 
@@ -79,6 +113,7 @@ class ColorButton(QtWidgets.QPushButton):
         text_color = "black" if sum(self._color) > 1.5 else "white"
         self.setStyleSheet(f"background-color: rgb({r}, {g}, {b}); color: {text_color};")
 
+    @QtCore.Slot()
     def choose_color(self):
         current_color = QtGui.QColor(int(self._color[0] * 255),
                                      int(self._color[1] * 255),
@@ -101,6 +136,18 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
         # Store state
         self.shot_mask_data = None  # Store shot mask nodes if created
         
+        # Coalesces a burst of name/version edits into one filename preview update
+        self._preview_timer = QtCore.QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(50)
+        self._preview_timer.timeout.connect(self.update_filename_preview)
+        
+        # Scene cameras, listed once and kept until cameras or the scene change
+        self._camera_cache = None
+        self._camera_refresh_pending = False
+        self._camera_cb_ids = []
+        self._add_camera_callbacks()
+        
         # Create main layout and tabs
         self.main_layout = QtWidgets.QVBoxLayout(self)
         
@@ -118,20 +165,49 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
         # Add tab widget to main layout
         self.main_layout.addWidget(self.main_tab_wdg)
         
-        # Setup each tab's content
+        # Setup the Playblast tab now; the Shot Mask and Settings tabs are
+        # built the first time they are opened (or read from another tab).
         self.setup_playblast_tab()
-        self.setup_shot_mask_tab()
-        self.setup_settings_tab()
+        self._tabs_built = {0: True, 1: False, 2: False}
+        self.main_tab_wdg.currentChanged.connect(self._ensure_tab_built)
         
         # Setup connections
         self.create_connections()
         
-        # Initialize UI with default values
-        self.refresh_cameras()
-        self.refresh_resolution()
-        self.refresh_frame_range()
+        # Initialize UI with default values. The Maya queries run once Maya is
+        # idle, so the window can be shown first.
         self.refresh_encoders()
         self.update_filename_preview()
+        maya.utils.executeDeferred(self._initial_populate)
+
+    @QtCore.Slot(int)
+    def _ensure_tab_built(self, index):
+        """Build a tab's widgets and connections the first time it is needed."""
+        if self._tabs_built.get(index, True):
+            return
+        self._tabs_built[index] = True
+        if index == 1:
+            self.setup_shot_mask_tab()
+            self.create_shot_mask_connections()
+            # Pick up a name typed in before the tab existed
+            self.update_user_field()
+        elif index == 2:
+            self.setup_settings_tab()
+            self.create_settings_connections()
+
+    def _initial_populate(self):
+        """Fill the scene-dependent fields from a single pass of Maya queries."""
+        if not isValid(self):
+            # Closed and deleted before Maya got to this
+            return
+        try:
+            scene_values = _query_scene_values()
+        except (RuntimeError, ValueError) as e:
+            cmds.warning(f"Error reading scene settings: {str(e)}")
+            scene_values = None
+        self.refresh_cameras()
+        self.refresh_resolution(scene_values)
+        self.refresh_frame_range(scene_values)
 
     def setup_playblast_tab(self):
         # Create layout for the tab
@@ -519,10 +595,34 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
         self.ffmpeg_path_label = QtWidgets.QLabel("FFmpeg Path:")
         self.ffmpeg_path_le = QtWidgets.QLineEdit()
         self.ffmpeg_path_select_btn = QtWidgets.QPushButton("...")
+        self.ffmpeg_redetect_btn = QtWidgets.QPushButton("Re-detect")
+        self.ffmpeg_redetect_btn.setToolTip("Check FFmpeg and its encoders again")
         
         ffmpeg_layout.addWidget(self.ffmpeg_path_label, 0, 0)
         ffmpeg_layout.addWidget(self.ffmpeg_path_le, 0, 1)
         ffmpeg_layout.addWidget(self.ffmpeg_path_select_btn, 0, 2)
+        ffmpeg_layout.addWidget(self.ffmpeg_redetect_btn, 0, 3)
+        
+        import conestoga_playblast_presets as presets
+        import conestoga_playblast_utils as utils
+        self.hw_encoder_label = QtWidgets.QLabel("Hardware Encoder:")
+        self.hw_encoder_combo = QtWidgets.QComboBox()
+        self.hw_encoder_combo.addItems(presets.HW_ENCODER_PREFERENCES)
+        self.hw_encoder_combo.setCurrentText(utils.load_option_var("hwEncoder", presets.DEFAULT_HW_ENCODER))
+        self.hw_encoder_combo.setToolTip("GPU encoder used for H.264/H.265 (auto picks the first one ffmpeg supports)")
+        
+        ffmpeg_layout.addWidget(self.hw_encoder_label, 1, 0)
+        ffmpeg_layout.addWidget(self.hw_encoder_combo, 1, 1)
+        
+        self.ffmpeg_threads_label = QtWidgets.QLabel("Threads:")
+        self.ffmpeg_threads_spinbox = QtWidgets.QSpinBox()
+        self.ffmpeg_threads_spinbox.setRange(0, 128)
+        self.ffmpeg_threads_spinbox.setSpecialValueText("Auto")
+        self.ffmpeg_threads_spinbox.setValue(int(utils.load_option_var("ffmpegThreads", os.cpu_count() or 1)))
+        self.ffmpeg_threads_spinbox.setToolTip("Number of threads ffmpeg uses to encode")
+        
+        ffmpeg_layout.addWidget(self.ffmpeg_threads_label, 2, 0)
+        ffmpeg_layout.addWidget(self.ffmpeg_threads_spinbox, 2, 1)
         
         settings_layout.addWidget(ffmpeg_group)
         
@@ -534,9 +634,18 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
         self.temp_dir_le = QtWidgets.QLineEdit()
         self.temp_dir_select_btn = QtWidgets.QPushButton("...")
         
+        import conestoga_playblast_presets as presets
+        import conestoga_playblast_utils as utils
+        self.temp_dir_le.setText(utils.load_option_var("tempDirectory", ""))
         self.temp_file_format_label = QtWidgets.QLabel("Temp File Format:")
         self.temp_file_format_combo = QtWidgets.QComboBox()
-        self.temp_file_format_combo.addItems(["movie", "png", "tga", "tif"])
+        self.temp_file_format_combo.addItems(presets.TEMP_INTERMEDIATE_PREFERENCES)
+        self.temp_file_format_combo.setCurrentText(utils.load_option_var("tempIntermediate", presets.DEFAULT_TEMP_INTERMEDIATE))
+        self.temp_file_format_combo.setToolTip(
+            "Image format Maya writes before ffmpeg encodes the movie.\n"
+            "auto: PNG for ProRes or Very High quality, JPEG otherwise.\n"
+            "JPEG is fastest but uses chroma subsampling, which can soften thin colored lines."
+        )
         
         temp_dir_layout.addWidget(self.temp_dir_label, 0, 0)
         temp_dir_layout.addWidget(self.temp_dir_le, 0, 1)
@@ -594,12 +703,12 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
         self.camera_hide_defaults_cb.toggled.connect(self.refresh_cameras)
         
         self.resolution_combo.currentTextChanged.connect(self.on_resolution_changed)
-        self.width_spinbox.valueChanged.connect(lambda: self.resolution_combo.setCurrentText("Custom"))
-        self.height_spinbox.valueChanged.connect(lambda: self.resolution_combo.setCurrentText("Custom"))
+        self.width_spinbox.valueChanged.connect(self._set_custom_resolution)
+        self.height_spinbox.valueChanged.connect(self._set_custom_resolution)
         
         self.frame_range_combo.currentTextChanged.connect(self.on_frame_range_changed)
-        self.start_frame_spinbox.valueChanged.connect(lambda: self.frame_range_combo.setCurrentText("Custom"))
-        self.end_frame_spinbox.valueChanged.connect(lambda: self.frame_range_combo.setCurrentText("Custom"))
+        self.start_frame_spinbox.valueChanged.connect(self._set_custom_frame_range)
+        self.end_frame_spinbox.valueChanged.connect(self._set_custom_frame_range)
         
         self.format_combo.currentTextChanged.connect(self.on_format_changed)
         self.encoder_settings_btn.clicked.connect(self.show_encoder_settings)
@@ -609,39 +718,43 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
         self.cancel_btn.clicked.connect(self.close)
         
         # Output name generator connections
-        self.assignment_spinbox.valueChanged.connect(self.update_filename_preview)
-        self.lastname_le.textChanged.connect(self.update_filename_preview)
-        self.firstname_le.textChanged.connect(self.update_filename_preview)
-        self.version_type_combo.currentTextChanged.connect(self.update_filename_preview)
-        self.version_number_spinbox.valueChanged.connect(self.update_filename_preview)
+        self.assignment_spinbox.valueChanged.connect(self._schedule_preview_update)
+        self.lastname_le.textChanged.connect(self._schedule_preview_update)
+        self.firstname_le.textChanged.connect(self._schedule_preview_update)
+        self.version_type_combo.currentTextChanged.connect(self._schedule_preview_update)
+        self.version_number_spinbox.valueChanged.connect(self._schedule_preview_update)
         self.generate_filename_btn.clicked.connect(self.generate_filename)
         
-        # Shot mask tab connections
-        self.vert_pos_slider.valueChanged.connect(lambda v: self.vert_pos_spinbox.setValue(v / 1000.0))
-        self.vert_pos_spinbox.valueChanged.connect(lambda v: self.vert_pos_slider.setValue(int(v * 1000)))
+        # Auto-update the user field when first/last name is entered
+        self.lastname_le.textChanged.connect(self.update_user_field)
+        self.firstname_le.textChanged.connect(self.update_user_field)
+
+    def create_shot_mask_connections(self):
+        self.vert_pos_slider.valueChanged.connect(self._sync_vert_slider_to_spin)
+        self.vert_pos_spinbox.valueChanged.connect(self._sync_vert_spin_to_slider)
         
-        self.z_dist_slider.valueChanged.connect(lambda v: self.z_dist_spinbox.setValue(v / 1000.0))
-        self.z_dist_spinbox.valueChanged.connect(lambda v: self.z_dist_slider.setValue(int(v * 1000)))
+        self.z_dist_slider.valueChanged.connect(self._sync_z_dist_slider_to_spin)
+        self.z_dist_spinbox.valueChanged.connect(self._sync_z_dist_spin_to_slider)
         
-        self.ann_size_slider.valueChanged.connect(lambda v: self.ann_size_spinbox.setValue(v / 10.0))
-        self.ann_size_spinbox.valueChanged.connect(lambda v: self.ann_size_slider.setValue(int(v * 10)))
+        self.ann_size_slider.valueChanged.connect(self._sync_ann_size_slider_to_spin)
+        self.ann_size_spinbox.valueChanged.connect(self._sync_ann_size_spin_to_slider)
         
         self.aspect_ratio_borders_cb.toggled.connect(self.on_aspect_ratio_borders_toggled)
         
         self.create_mask_btn.clicked.connect(self.create_shot_mask)
         self.remove_mask_btn.clicked.connect(self.remove_shot_mask)
-        
-        # Settings tab connections
+
+    def create_settings_connections(self):
         self.ffmpeg_path_select_btn.clicked.connect(self.browse_ffmpeg_path)
+        self.ffmpeg_redetect_btn.clicked.connect(self.redetect_ffmpeg)
+        self.hw_encoder_combo.currentTextChanged.connect(self.on_hw_encoder_changed)
+        self.ffmpeg_threads_spinbox.valueChanged.connect(self.on_ffmpeg_threads_changed)
         self.temp_dir_select_btn.clicked.connect(self.browse_temp_dir)
+        self.temp_file_format_combo.currentTextChanged.connect(self.on_temp_file_format_changed)
         self.logo_path_select_btn.clicked.connect(self.browse_logo_path)
         
         self.reset_playblast_btn.clicked.connect(self.reset_playblast_settings)
         self.reset_shot_mask_btn.clicked.connect(self.reset_shot_mask_settings)
-        
-        # Auto-update the user field when first/last name is entered
-        self.lastname_le.textChanged.connect(self.update_user_field)
-        self.firstname_le.textChanged.connect(self.update_user_field)
 
     # Utility methods
     def get_maya_main_window():
@@ -650,6 +763,7 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
         return wrapInstance(int(ptr), QtWidgets.QWidget) if ptr else None
 
     # Implementation methods
+    @QtCore.Slot()
     def browse_output_dir(self):
         current_dir = self.output_dir_le.text()
         if not current_dir:
@@ -659,6 +773,7 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
         if new_dir:
             self.output_dir_le.setText(new_dir[0])
 
+    @QtCore.Slot()
     def open_output_dir(self):
         dir_path = self.output_dir_le.text()
         if not dir_path:
@@ -670,10 +785,57 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
         else:
             cmds.warning(f"Directory does not exist: {dir_path}")
 
+    def _add_camera_callbacks(self):
+        """Invalidate the camera cache when a camera is added, removed or renamed, or the scene changes."""
+        self._camera_cb_ids = [
+            om.MSceneMessage.addCallback(om.MSceneMessage.kAfterNew, self._invalidate_camera_cache),
+            om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, self._invalidate_camera_cache),
+            om.MDGMessage.addNodeAddedCallback(self._invalidate_camera_cache, "camera"),
+            om.MDGMessage.addNodeRemovedCallback(self._invalidate_camera_cache, "camera"),
+            # A null MObject watches every node; _on_node_renamed keeps only cameras
+            om.MNodeMessage.addNameChangedCallback(om.MObject(), self._on_node_renamed),
+        ]
+
+    def _remove_camera_callbacks(self):
+        if self._camera_cb_ids:
+            om.MMessage.removeCallbacks(self._camera_cb_ids)
+            self._camera_cb_ids = []
+
+    def _invalidate_camera_cache(self, *args):
+        self._camera_cache = None
+        # Refilled once Maya is idle again, however many cameras a file load adds
+        if not self._camera_refresh_pending and self.isVisible():
+            self._camera_refresh_pending = True
+            QtCore.QTimer.singleShot(0, self._refresh_cameras_deferred)
+
+    def _on_node_renamed(self, node, previous_name, *args):
+        # listCameras returns transform names, so a camera's transform counts too
+        if node.hasFn(om.MFn.kCamera):
+            self._invalidate_camera_cache()
+        elif node.hasFn(om.MFn.kTransform):
+            dag_fn = om.MFnDagNode(node)
+            if any(dag_fn.child(i).hasFn(om.MFn.kCamera) for i in range(dag_fn.childCount())):
+                self._invalidate_camera_cache()
+
+    def _refresh_cameras_deferred(self):
+        self._camera_refresh_pending = False
+        self.refresh_cameras()
+
+    def _get_cameras(self):
+        """Get the scene cameras, listed at most once per camera or scene change."""
+        if self._camera_cache is None:
+            self._camera_cache = cmds.listCameras()
+        return self._camera_cache
+
+    def closeEvent(self, event):
+        self._remove_camera_callbacks()
+        super(ConestoggZurbriggPlayblastDialog, self).closeEvent(event)
+
+    @QtCore.Slot()
     def refresh_cameras(self):
         self.camera_combo.clear()
         
-        cameras = cmds.listCameras()
+        cameras = self._get_cameras()
         
         if not self.camera_hide_defaults_cb.isChecked():
             self.camera_combo.addItems(cameras)
@@ -683,13 +845,16 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
             filtered_cameras = [cam for cam in cameras if cam not in default_cameras]
             self.camera_combo.addItems(filtered_cameras)
 
-    def refresh_resolution(self):
+    def refresh_resolution(self, scene_values=None):
         preset = self.resolution_combo.currentText()
         if preset == "Custom":
             return
         
         try:
-            if preset == "Render":
+            if preset == "Render" and scene_values:
+                width = int(scene_values["width"])
+                height = int(scene_values["height"])
+            elif preset == "Render":
                 width = cmds.getAttr("defaultResolution.width")
                 height = cmds.getAttr("defaultResolution.height")
             else:
@@ -701,18 +866,23 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
                 }
                 width, height = resolutions.get(preset, (1920, 1080))
             
-            self.width_spinbox.setValue(width)
-            self.height_spinbox.setValue(height)
+            # Setting the fields from the preset must not switch it to "Custom"
+            with QtCore.QSignalBlocker(self.width_spinbox), QtCore.QSignalBlocker(self.height_spinbox):
+                self.width_spinbox.setValue(width)
+                self.height_spinbox.setValue(height)
         except Exception as e:
             cmds.warning(f"Error setting resolution: {str(e)}")
 
-    def refresh_frame_range(self):
+    def refresh_frame_range(self, scene_values=None):
         preset = self.frame_range_combo.currentText()
         if preset == "Custom":
             return
         
         try:
-            if preset == "Playback":
+            if scene_values and preset in _FRAME_RANGE_VALUE_KEYS:
+                start_key, end_key = _FRAME_RANGE_VALUE_KEYS[preset]
+                start, end = scene_values[start_key], scene_values[end_key]
+            elif preset == "Playback":
                 start = cmds.playbackOptions(query=True, minTime=True)
                 end = cmds.playbackOptions(query=True, maxTime=True)
             elif preset == "Animation":
@@ -724,8 +894,10 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
             else:
                 return
             
-            self.start_frame_spinbox.setValue(int(start))
-            self.end_frame_spinbox.setValue(int(end))
+            # Setting the fields from the preset must not switch it to "Custom"
+            with QtCore.QSignalBlocker(self.start_frame_spinbox), QtCore.QSignalBlocker(self.end_frame_spinbox):
+                self.start_frame_spinbox.setValue(int(start))
+                self.end_frame_spinbox.setValue(int(end))
         except Exception as e:
             cmds.warning(f"Error setting frame range: {str(e)}")
 
@@ -742,15 +914,23 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
         if format_name in video_encoder_lookup:
             self.encoder_combo.addItems(video_encoder_lookup[format_name])
 
+    @QtCore.Slot(str)
     def on_resolution_changed(self, preset):
         self.refresh_resolution()
 
+    @QtCore.Slot(str)
     def on_frame_range_changed(self, preset):
         self.refresh_frame_range()
 
+    @QtCore.Slot(str)
     def on_format_changed(self, format_name):
         self.refresh_encoders()
 
+    @QtCore.Slot()
+    def _schedule_preview_update(self):
+        self._preview_timer.start()
+
+    @QtCore.Slot()
     def update_filename_preview(self):
         assignment = self.assignment_spinbox.value()
         lastname = self.lastname_le.text() or "LastName"
@@ -761,6 +941,7 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
         filename = f"A{assignment}*{lastname}*{firstname}*{version_type}*{version_number}.mov"
         self.filename_preview_label.setText(filename)
 
+    @QtCore.Slot()
     def generate_filename(self):
         assignment = self.assignment_spinbox.value()
         lastname = self.lastname_le.text()
@@ -775,27 +956,77 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
         filename = f"A{assignment}_{lastname}_{firstname}_{version_type}_{version_number}.mov"
         self.output_filename_le.setText(filename)
         
+        if not self._tabs_built[1]:
+            # The Shot Mask tab picks the name up when it is built
+            return
         if self.bottom_left_le.text() == "Artist: {username}":
             self.bottom_left_le.setText(f"Artist: {firstname} {lastname}")
 
+    @QtCore.Slot()
     def update_user_field(self):
         firstname = self.firstname_le.text()
         lastname = self.lastname_le.text()
         
+        if not self._tabs_built[1]:
+            return
         if firstname or lastname:
             full_name = f"{firstname} {lastname}".strip()
             if self.bottom_left_le.text().startswith("Artist:"):
                 self.bottom_left_le.setText(f"Artist: {full_name}")
 
+    @QtCore.Slot()
+    def _set_custom_resolution(self):
+        self.resolution_combo.setCurrentText("Custom")
+
+    @QtCore.Slot()
+    def _set_custom_frame_range(self):
+        self.frame_range_combo.setCurrentText("Custom")
+
+    # Slider/spin box pairs. The partner's signals are blocked while it is set,
+    # so a drag step does not bounce back into the widget that sent it.
+    @QtCore.Slot(int)
+    def _sync_vert_slider_to_spin(self, value):
+        with QtCore.QSignalBlocker(self.vert_pos_spinbox):
+            self.vert_pos_spinbox.setValue(value / 1000.0)
+
+    @QtCore.Slot(float)
+    def _sync_vert_spin_to_slider(self, value):
+        with QtCore.QSignalBlocker(self.vert_pos_slider):
+            self.vert_pos_slider.setValue(int(value * 1000))
+
+    @QtCore.Slot(int)
+    def _sync_z_dist_slider_to_spin(self, value):
+        with QtCore.QSignalBlocker(self.z_dist_spinbox):
+            self.z_dist_spinbox.setValue(value / 1000.0)
+
+    @QtCore.Slot(float)
+    def _sync_z_dist_spin_to_slider(self, value):
+        with QtCore.QSignalBlocker(self.z_dist_slider):
+            self.z_dist_slider.setValue(int(value * 1000))
+
+    @QtCore.Slot(int)
+    def _sync_ann_size_slider_to_spin(self, value):
+        with QtCore.QSignalBlocker(self.ann_size_spinbox):
+            self.ann_size_spinbox.setValue(value / 10.0)
+
+    @QtCore.Slot(float)
+    def _sync_ann_size_spin_to_slider(self, value):
+        with QtCore.QSignalBlocker(self.ann_size_slider):
+            self.ann_size_slider.setValue(int(value * 10))
+
+    @QtCore.Slot(bool)
     def on_aspect_ratio_borders_toggled(self, enabled):
         self.border_scale_spinbox.setVisible(not enabled)
         self.aspect_ratio_spinbox.setVisible(enabled)
 
+    @QtCore.Slot()
     def show_encoder_settings(self):
         pass
 
+    @QtCore.Slot()
     def create_shot_mask(self):
         """Create or update shot mask with current settings"""
+        self._ensure_tab_built(1)
         try:
             self.remove_shot_mask()
             
@@ -901,50 +1132,37 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
     def parse_shot_mask_text(self, text, camera):
         if not text:
             return ""
-        
-        if "{scene}" in text:
+        # Each tag is resolved at most once, and only if the text uses it
+        resolved = {}
+
+        def replace_tag(match):
+            tag = match.group(1)
+            if tag not in resolved:
+                resolved[tag] = self._resolve_shot_mask_tag(tag, camera)
+            return resolved[tag]
+
+        return _MASK_TAG_RE.sub(replace_tag, text)
+
+    def _resolve_shot_mask_tag(self, tag, camera):
+        """Return the text for one shot mask tag"""
+        if tag == "scene":
             scene_name = cmds.file(query=True, sceneName=True, shortName=True)
-            scene_name = os.path.splitext(scene_name)[0] if scene_name else "untitled"
-            text = text.replace("{scene}", scene_name)
-        
-        if "{camera}" in text:
-            camera_name = camera.split('|')[-1].split(':')[-1]
-            text = text.replace("{camera}", camera_name)
-        
-        if "{counter}" in text:
-            current_frame = int(cmds.currentTime(query=True))
-            text = text.replace("{counter}", str(current_frame))
-        
-        if "{fps}" in text:
-            time_unit = cmds.currentUnit(query=True, time=True)
-            fps = 24
-            if time_unit == "film":
-                fps = 24
-            elif time_unit == "pal":
-                fps = 25
-            elif time_unit == "ntsc":
-                fps = 30
-            elif time_unit == "game":
-                fps = 15
-            elif time_unit.endswith("fps"):
-                fps = float(time_unit[:-3])
-            text = text.replace("{fps}", str(fps))
-        
-        if "{date}" in text:
-            today = datetime.datetime.today()
-            date_str = today.strftime("%Y-%m-%d")
-            text = text.replace("{date}", date_str)
-        
-        if "{username}" in text:
-            user_name = ""
-            if hasattr(self, "firstname_le") and hasattr(self, "lastname_le"):
-                if self.firstname_le.text() and self.lastname_le.text():
-                    user_name = f"{self.firstname_le.text()} {self.lastname_le.text()}"
-            if not user_name:
-                user_name = os.environ.get("USER", "Artist")
-            text = text.replace("{username}", user_name)
-        
-        return text
+            return os.path.splitext(scene_name)[0] if scene_name else "untitled"
+        if tag == "camera":
+            return camera.split('|')[-1].split(':')[-1]
+        if tag == "counter":
+            return str(int(cmds.currentTime(query=True)))
+        if tag == "fps":
+            import conestoga_playblast_utils as utils
+            return f"{utils.get_frame_rate():g}"
+        if tag == "date":
+            return datetime.datetime.today().strftime("%Y-%m-%d")
+        # username
+        user_name = ""
+        if hasattr(self, "firstname_le") and hasattr(self, "lastname_le"):
+            if self.firstname_le.text() and self.lastname_le.text():
+                user_name = f"{self.firstname_le.text()} {self.lastname_le.text()}"
+        return user_name or os.environ.get("USER", "Artist")
 
     def update_shot_mask_position(self, y_offset=None, z_distance=None):
         if not cmds.objExists("shotMask_MainGroup"):
@@ -958,6 +1176,7 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
         
         return True
 
+    @QtCore.Slot()
     def remove_shot_mask(self):
         try:
             if self.shot_mask_data and "main_group" in self.shot_mask_data:
@@ -983,6 +1202,7 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
             traceback.print_exc()
             return False
 
+    @QtCore.Slot()
     def do_playblast(self):
         """Create playblast with current settings"""
         try:
@@ -1011,6 +1231,7 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
             
             shot_mask_settings = None
             if shot_mask:
+                self._ensure_tab_built(1)
                 shot_mask_settings = {
                     "topLeftText": self.top_left_le.text(),
                     "topCenterText": self.top_center_le.text(),
@@ -1041,7 +1262,7 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
                 quality=quality,
                 shot_mask=shot_mask,
                 shot_mask_settings=shot_mask_settings,
-                show_in_viewer=show_in_viewer,
+                open_in_viewer=show_in_viewer,
                 force_overwrite=force_overwrite
             )
             
@@ -1062,6 +1283,7 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
             QtWidgets.QMessageBox.critical(self, "Error", f"An error occurred during playblast:\n{str(e)}")
             return None
 
+    @QtCore.Slot()
     def reset_playblast_settings(self):
         """Reset all playblast settings to defaults"""
         confirmation = QtWidgets.QMessageBox.question(
@@ -1099,6 +1321,7 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
             
             self.update_filename_preview()
 
+    @QtCore.Slot()
     def reset_shot_mask_settings(self):
         """Reset shot mask settings to defaults"""
         confirmation = QtWidgets.QMessageBox.question(
@@ -1109,6 +1332,7 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
         )
         
         if confirmation == QtWidgets.QMessageBox.Yes:
+            self._ensure_tab_built(1)
             self.top_left_le.setText("Scene: {scene}")
             self.top_center_le.setText("")
             self.top_right_le.setText("FPS: {fps}")
@@ -1134,6 +1358,7 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
                 self.remove_shot_mask()
                 self.create_shot_mask()
 
+    @QtCore.Slot()
     def browse_ffmpeg_path(self):
         """Browse for ffmpeg executable"""
         current_path = self.ffmpeg_path_le.text()
@@ -1155,7 +1380,42 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
                 conestoga_playblast.set_ffmpeg_path(new_path)
             else:
                 cmds.warning("Could not update ffmpeg path in plugin.")
+            import conestoga_playblast_utils as utils
+            utils.invalidate_ffmpeg_cache()
+
+    @QtCore.Slot()
+    def redetect_ffmpeg(self):
+        """Drop the cached FFmpeg checks and report what is found now"""
+        import conestoga_playblast_presets as presets
+        import conestoga_playblast_utils as utils
+        utils.invalidate_ffmpeg_cache()
+        if utils.is_ffmpeg_available():
+            preference = utils.load_option_var("hwEncoder", presets.DEFAULT_HW_ENCODER)
+            encoder = utils.get_hw_encoder("h264", preference) or "libx264"
+            message = f"FFmpeg found at:\n{utils.get_ffmpeg_path()}\n\nH.264 encoder: {encoder}"
+        else:
+            message = "FFmpeg was not found. Set its path above."
+        QtWidgets.QMessageBox.information(self, "FFmpeg", message)
+
+    @QtCore.Slot(str)
+    def on_hw_encoder_changed(self, preference):
+        """Store the hardware encoder preference"""
+        import conestoga_playblast_utils as utils
+        utils.save_option_var("hwEncoder", preference)
+
+    @QtCore.Slot(int)
+    def on_ffmpeg_threads_changed(self, threads):
+        """Store the ffmpeg thread count"""
+        import conestoga_playblast_utils as utils
+        utils.save_option_var("ffmpegThreads", threads)
+
+    @QtCore.Slot(str)
+    def on_temp_file_format_changed(self, preference):
+        """Store the intermediate image format preference"""
+        import conestoga_playblast_utils as utils
+        utils.save_option_var("tempIntermediate", preference)
 
+    @QtCore.Slot()
     def browse_temp_dir(self):
         """Browse for temporary directory"""
         current_dir = self.temp_dir_le.text()
@@ -1174,6 +1434,7 @@ class ConestoggZurbriggPlayblastDialog(QtWidgets.QWidget):
             else:
                 cmds.warning("Could not update temp directory in plugin.")
 
+    @QtCore.Slot()
     def browse_logo_path(self):
         """Browse for logo image file"""
         current_path = self.logo_path_le.text()
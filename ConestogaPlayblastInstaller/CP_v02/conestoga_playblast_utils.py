@@ -12,6 +12,9 @@ import platform
 import tempfile
 import shutil
 import re
+import threading
+import collections
+import functools
 import maya.cmds as cmds
 
 # Add script directory to path if needed
@@ -23,6 +26,32 @@ import conestoga_playblast_presets as presets
 # Removed circular self-import:
 # import conestoga_playblast_utils as utils
 
+# One "key=value" line of ffmpeg's -progress output
+_PROGRESS_LINE_RE = re.compile(r"^(\w+)=(\S*)$")
+# (QtGui, QtCore) imported by _import_qt() on first use
+_qt_modules = None
+
+def _import_qt():
+    """
+    Import the Qt modules on first use, preferring PySide6 over PySide2.
+
+    Qt is not imported at module load, so headless mayapy batches never pay for it.
+
+    Returns:
+        tuple: (QtGui, QtCore), or (None, None) if Qt is not available.
+    """
+    global _qt_modules
+    if _qt_modules is None:
+        _qt_modules = (None, None)
+        for module_name in ("PySide6", "PySide2"):
+            try:
+                module = __import__(module_name, fromlist=["QtGui", "QtCore"])
+            except ImportError:
+                continue
+            _qt_modules = (module.QtGui, module.QtCore)
+            break
+    return _qt_modules
+
 # ===========================================================================
 # INTEGRATION UTILITIES
 # ===========================================================================
@@ -49,8 +78,7 @@ def render_and_playblast(camera, output_dir=None, render_settings=None, playblas
     # Default output directory
     if not output_dir:
         output_dir = os.path.join(cmds.workspace(query=True, rootDirectory=True), "images", "playblast_compare")
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
     
     # Store original render settings
     orig_renderer = cmds.getAttr("defaultRenderGlobals.currentRenderer")
@@ -75,7 +103,7 @@ def render_and_playblast(camera, output_dir=None, render_settings=None, playblas
         import conestoga_playblast
         playblast_settings["camera"] = camera
         playblast_settings["output_dir"] = output_dir
-        playblast_settings["show_in_viewer"] = True
+        playblast_settings["open_in_viewer"] = True
         
         playblast_path = conestoga_playblast.create_playblast(**playblast_settings)
         
@@ -145,7 +173,7 @@ def create_gif_from_playblast(playblast_path, output_dir=None, width=None, fps=1
         cmds.warning(f"Error creating GIF: {e}")
         return None
     finally:
-        shutil.rmtree(temp_dir)
+        batch_unlink_tree(temp_dir)
 
 
 def export_playblast_frames(playblast_path, output_dir=None, format="png"):
@@ -173,8 +201,7 @@ def export_playblast_frames(playblast_path, output_dir=None, format="png"):
         base_name = os.path.splitext(os.path.basename(playblast_path))[0]
         output_dir = os.path.join(os.path.dirname(playblast_path), f"{base_name}_frames")
     
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
     
     output_pattern = os.path.join(output_dir, f"frame_%04d.{format}")
     try:
@@ -240,12 +267,30 @@ def compare_playblasts(playblast_a, playblast_b, output_dir=None):
 # VIEWPORT MANAGEMENT FUNCTIONS (from working_utils_v01.py)
 # ===========================================================================
 
+def get_valid_model_panel():
+    """
+    Return the model panel to playblast through.
+
+    Prefers the panel with focus, then the first visible model panel, then any
+    model panel. Returns None if there is none (e.g. in batch mode).
+    """
+    focused = cmds.getPanel(withFocus=True)
+    if focused and cmds.getPanel(typeOf=focused) == "modelPanel":
+        return focused
+    model_panels = cmds.getPanel(type="modelPanel") or []
+    visible = set(cmds.getPanel(visiblePanels=True) or [])
+    for panel in model_panels:
+        if panel in visible:
+            return panel
+    return model_panels[0] if model_panels else None
+
 def get_viewport_defaults(model_panel, camera):
     """Get default viewport settings for restoration later."""
     if not model_panel or not cmds.modelPanel(model_panel, exists=True):
         return None
     defaults = {}
     defaults["camera"] = cmds.modelPanel(model_panel, query=True, camera=True)
+    defaults["rendererName"] = cmds.modelEditor(model_panel, query=True, rendererName=True)
     for item_name, command_flag in presets.VIEWPORT_VISIBILITY_LOOKUP:
         try:
             defaults[command_flag] = cmds.modelEditor(model_panel, query=True, **{command_flag: True})
@@ -258,6 +303,12 @@ def set_final_viewport(model_panel, camera, viewport_preset="Standard"):
     if not model_panel or not cmds.modelPanel(model_panel, exists=True):
         return False
     cmds.lookThru(camera)
+    # Capture through Viewport 2.0 so frames are read back from the GPU render
+    # target instead of going through the legacy viewport's CPU path
+    try:
+        cmds.modelEditor(model_panel, edit=True, rendererName="vp2Renderer")
+    except Exception:
+        pass
     visibility_flags = {}
     if viewport_preset in presets.VIEWPORT_VISIBILITY_PRESETS:
         preset_items = presets.VIEWPORT_VISIBILITY_PRESETS[viewport_preset]
@@ -314,6 +365,19 @@ def restore_image_planes(image_plane_states):
             cmds.setAttr(display_attr, display_mode)
     return True
 
+def get_frame_rate():
+    """Return the scene's frame rate in frames per second (24 if the unit is unknown)."""
+    time_unit = cmds.currentUnit(query=True, time=True)
+    fps = presets.FRAME_RATES.get(time_unit)
+    if fps is not None:
+        return fps
+    if time_unit.endswith("fps"):
+        try:
+            return float(time_unit[:-3])
+        except ValueError:
+            pass
+    return 24.0
+
 def get_camera_shape(camera):
     """Return the shape node of the given camera."""
     shapes = cmds.listRelatives(camera, shapes=True)
@@ -382,26 +446,27 @@ def create_shot_mask(camera, user_name, scene_name=None, text_color=None):
     }
     return mask_data
 
+def retarget_shot_mask(mask_data, camera):
+    """Move a shot mask made by create_shot_mask() onto another camera."""
+    mask_transform = mask_data["transform"]
+    constraints = cmds.listRelatives(mask_transform, type="parentConstraint") or []
+    if constraints:
+        cmds.delete(constraints)
+    cmds.parentConstraint(camera, mask_transform, maintainOffset=False)
+    mask_data["camera"] = camera
+    return mask_data
+
 def create_shot_mask_text(mask_transform, scene_name, user_name, text_sg):
     """Create text elements for the shot mask."""
     import datetime
     current_time = int(cmds.currentTime(query=True))
-    time_unit = cmds.currentUnit(query=True, time=True)
-    fps = 24
-    if time_unit == "film":
-        fps = 24
-    elif time_unit == "pal":
-        fps = 25
-    elif time_unit == "ntsc":
-        fps = 30
-    elif time_unit.endswith("fps"):
-        fps = float(time_unit[:-3])
+    fps = get_frame_rate()
     today = datetime.datetime.today()
     date_str = today.strftime("%Y-%m-%d")
     text_scale = 0.04
     text_positions = {
         "Scene": {"text": f"Scene: {scene_name}", "pos": (-0.45, 0.45)},
-        "FPS": {"text": f"FPS: {fps}", "pos": (0.45, 0.45)},
+        "FPS": {"text": f"FPS: {fps:g}", "pos": (0.45, 0.45)},
         "Artist": {"text": f"Artist: {user_name}", "pos": (-0.45, -0.45)},
     }
     for key, value in text_positions.items():
@@ -411,6 +476,61 @@ def create_shot_mask_text(mask_transform, scene_name, user_name, text_sg):
         cmds.setAttr(f"{text_obj}.scale", text_scale, text_scale, text_scale, type="double3")
         cmds.sets(text_obj, edit=True, forceElement=text_sg)
 
+def create_shot_mask_overlay(output_path, width, height, scene_name, user_name, fps, text_color=None):
+    """
+    Render the shot mask once to a transparent PNG that ffmpeg composites over
+    every frame, instead of adding mask nodes to the scene.
+
+    Args:
+        output_path (str): Path of the PNG to write.
+        width (int): Playblast width in pixels.
+        height (int): Playblast height in pixels.
+        scene_name (str): Scene name shown in the mask.
+        user_name (str): Artist name shown in the mask.
+        fps (float): Frame rate shown in the mask.
+        text_color (tuple): Text color as RGB floats.
+
+    Returns:
+        str: Path to the overlay image, or None if it could not be rendered.
+    """
+    QtGui, QtCore = _import_qt()
+    if QtGui is None:
+        cmds.warning("Qt is not available. Cannot render the shot mask overlay.")
+        return None
+    if text_color is None:
+        text_color = (1.0, 1.0, 1.0)
+
+    bar_height = max(2, int(height * 0.05))
+    margin = bar_height // 2
+    fps_text = f"{fps:g}" if isinstance(fps, float) else str(fps)
+
+    image = QtGui.QImage(width, height, QtGui.QImage.Format_ARGB32)
+    image.fill(QtGui.QColor(0, 0, 0, 0))
+    painter = QtGui.QPainter(image)
+    try:
+        # Same gray as the shot mask material
+        bar_color = QtGui.QColor.fromRgbF(0.15, 0.15, 0.15)
+        painter.fillRect(0, 0, width, bar_height, bar_color)
+        painter.fillRect(0, height - bar_height, width, bar_height, bar_color)
+
+        font = painter.font()
+        font.setPixelSize(max(1, bar_height // 2))
+        painter.setFont(font)
+        painter.setPen(QtGui.QColor.fromRgbF(text_color[0], text_color[1], text_color[2]))
+
+        top_rect = QtCore.QRect(margin, 0, width - 2 * margin, bar_height)
+        bottom_rect = QtCore.QRect(margin, height - bar_height, width - 2 * margin, bar_height)
+        painter.drawText(top_rect, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter, f"Scene: {scene_name}")
+        painter.drawText(top_rect, QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter, f"FPS: {fps_text}")
+        painter.drawText(bottom_rect, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter, f"Artist: {user_name}")
+    finally:
+        painter.end()
+
+    if not image.save(output_path, "PNG"):
+        cmds.warning(f"Could not write shot mask overlay: {output_path}")
+        return None
+    return output_path
+
 def remove_shot_mask():
     """Remove any existing shot mask from the scene."""
     from conestoga_playblast_presets import MASK_PREFIX
@@ -436,7 +556,7 @@ def toggle_shot_mask(camera=None, user_name=None):
     else:
         # If no camera provided, try to get the active camera
         if camera is None:
-            panel = get_valid_model_panel()  # Make sure this function exists
+            panel = get_valid_model_panel()
             if panel:
                 camera = cmds.modelPanel(panel, query=True, camera=True)
         # Use current user name if not provided
@@ -471,8 +591,7 @@ def generate_playblast_report(playblast_path, report_dir=None, include_screensho
     if report_dir is None:
         report_dir = os.path.dirname(playblast_path)
     
-    if not os.path.exists(report_dir):
-        os.makedirs(report_dir)
+    os.makedirs(report_dir, exist_ok=True)
     
     base_name = os.path.splitext(os.path.basename(playblast_path))[0]
     file_ext = os.path.splitext(playblast_path)[1]
@@ -636,8 +755,7 @@ def prepare_for_social_media(playblast_path, platform="all", output_dir=None):
         base_name = os.path.splitext(os.path.basename(playblast_path))[0]
         output_dir = os.path.join(os.path.dirname(playblast_path), f"{base_name}_social")
     
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
     
     results = {}
     base_name = os.path.splitext(os.path.basename(playblast_path))[0]
@@ -744,9 +862,12 @@ def export_camera_path_for_overlay(camera, start_frame, end_frame, output_dir=No
 # FFmpeg UTILITY FUNCTIONS
 # ===========================================================================
 
+@functools.lru_cache(maxsize=1)
 def get_ffmpeg_path():
     """
     Retrieve the FFmpeg executable path from presets or environment.
+
+    The result is cached; call invalidate_ffmpeg_cache() after changing the path.
     
     Returns:
         str: Path to FFmpeg executable or None if not found.
@@ -756,11 +877,518 @@ def get_ffmpeg_path():
         return ffmpeg_path
     return None
 
+@functools.lru_cache(maxsize=1)
 def is_ffmpeg_available():
     """
     Check if FFmpeg is available.
+
+    The result is cached; call invalidate_ffmpeg_cache() after changing the path.
     
     Returns:
         bool: True if FFmpeg is available, False otherwise.
     """
     return get_ffmpeg_path() is not None
+
+def invalidate_ffmpeg_cache():
+    """Forget the cached ffmpeg path, availability, encoder and filter lists."""
+    get_ffmpeg_path.cache_clear()
+    is_ffmpeg_available.cache_clear()
+    get_available_encoders.cache_clear()
+    get_available_filters.cache_clear()
+
+def load_option_var(name, default):
+    """
+    Read one of the tool's optionVars.
+
+    Args:
+        name (str): Option name without the tool prefix.
+        default: Value returned if the optionVar has not been set.
+
+    Returns:
+        The stored value, or the default.
+    """
+    var_name = f"{presets.OPTION_VAR_PREFIX}{name}"
+    if cmds.optionVar(exists=var_name):
+        return cmds.optionVar(query=var_name)
+    return default
+
+def save_option_var(name, value):
+    """
+    Store one of the tool's optionVars.
+
+    Args:
+        name (str): Option name without the tool prefix.
+        value (str, int or float): Value to store.
+    """
+    var_name = f"{presets.OPTION_VAR_PREFIX}{name}"
+    if isinstance(value, str):
+        cmds.optionVar(stringValue=(var_name, value))
+    elif isinstance(value, float):
+        cmds.optionVar(floatValue=(var_name, value))
+    else:
+        cmds.optionVar(intValue=(var_name, int(value)))
+
+@functools.lru_cache(maxsize=1)
+def get_available_encoders():
+    """
+    Get the names of the video encoders compiled into ffmpeg.
+
+    The list is read from `ffmpeg -encoders` once and cached; call
+    invalidate_ffmpeg_cache() to read it again.
+
+    Returns:
+        frozenset: Encoder names (e.g. "libx264", "h264_nvenc").
+    """
+    ffmpeg_path = get_ffmpeg_path()
+    if not ffmpeg_path:
+        return frozenset()
+
+    try:
+        result = subprocess.run([ffmpeg_path, "-hide_banner", "-encoders"],
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return frozenset()
+
+    encoders = set()
+    for line in result.stdout.decode(errors="replace").splitlines():
+        parts = line.split()
+        # Encoder lines look like " V....D h264_nvenc  NVIDIA NVENC H.264 encoder"
+        if len(parts) >= 2 and parts[0].startswith("V"):
+            encoders.add(parts[1])
+    return frozenset(encoders)
+
+@functools.lru_cache(maxsize=1)
+def get_available_filters():
+    """
+    Get the names of the filters compiled into ffmpeg.
+
+    The list is read from `ffmpeg -filters` once and cached; call
+    invalidate_ffmpeg_cache() to read it again.
+
+    Returns:
+        frozenset: Filter names (e.g. "scale", "hwupload_cuda").
+    """
+    ffmpeg_path = get_ffmpeg_path()
+    if not ffmpeg_path:
+        return frozenset()
+
+    try:
+        result = subprocess.run([ffmpeg_path, "-hide_banner", "-filters"],
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return frozenset()
+
+    filters = set()
+    for line in result.stdout.decode(errors="replace").splitlines():
+        parts = line.split()
+        # Filter lines look like " ... hwupload_cuda     V->V       Upload a system memory frame..."
+        if len(parts) >= 3 and "->" in parts[2]:
+            filters.add(parts[1])
+    return frozenset(filters)
+
+def get_hw_encoder(encoder, preference=presets.DEFAULT_HW_ENCODER):
+    """
+    Pick a hardware video encoder for the given codec.
+
+    Args:
+        encoder (str): Codec name ("h264" or "h265").
+        preference (str): "auto", "off" or a family from presets.HW_ENCODER_FAMILIES.
+
+    Returns:
+        str: ffmpeg encoder name (e.g. "h264_nvenc"), or None to use software encoding.
+    """
+    if encoder == "h264":
+        codec = "h264"
+    elif encoder == "h265":
+        codec = "hevc"
+    else:
+        return None
+
+    if preference == "auto":
+        families = presets.HW_ENCODER_FAMILIES
+    elif preference in presets.HW_ENCODER_FAMILIES:
+        families = [preference]
+    else:
+        return None
+
+    available = get_available_encoders()
+    for family in families:
+        name = f"{codec}_{family}"
+        if name in available:
+            return name
+    return None
+
+def build_ffmpeg_command(ffmpeg_path, input_args, output_path, settings):
+    """
+    Build an ffmpeg command line for encoding a playblast image sequence.
+
+    Args:
+        ffmpeg_path (str): Path to the ffmpeg executable.
+        input_args (list): Arguments describing the video input (e.g. ["-i", pattern]).
+        output_path (str): Path to the output movie.
+        settings (dict): Encoding settings ("encoder", "quality", "preset",
+            "framerate", and optionally "threads", "hw_encoder", "crf", "tune", "bframes",
+            "audio_path"/"audio_offset" and "overlay_path" for an image
+            composited over every frame).
+
+    Returns:
+        list: The ffmpeg command.
+    """
+    encoder = settings.get("encoder", presets.DEFAULT_ENCODER)
+    threads = settings.get("threads")
+    if threads is not None and encoder == "prores":
+        # prores_ks gains little from an explicit count; let ffmpeg decide
+        threads = 0
+
+    command = [ffmpeg_path, "-y", "-hide_banner", "-loglevel", "error"]
+    if threads is not None:
+        # Decoding threads for the image input
+        command += ["-threads", str(threads)]
+    command += [
+        "-thread_queue_size", "512",
+        "-framerate", str(settings.get("framerate", 24.0)),
+        *input_args
+    ]
+
+    next_input = 1
+    audio_path = settings.get("audio_path")
+    if audio_path:
+        command += ["-thread_queue_size", "512", "-itsoffset", str(settings.get("audio_offset", 0.0)), "-i", audio_path]
+        audio_input = next_input
+        next_input += 1
+
+    # libx264 and the yuv420p/yuv422p formats need even dimensions
+    pad_filter = "pad=ceil(iw/2)*2:ceil(ih/2)*2"
+    hw_encoder = settings.get("hw_encoder")
+    cuda_upload = bool(hw_encoder) and hw_encoder.endswith("_nvenc") and \
+        "hwupload_cuda" in get_available_filters()
+    if cuda_upload:
+        # Hand NVENC frames already in GPU memory, in its native nv12 layout
+        pad_filter += ",format=nv12,hwupload_cuda"
+    overlay_path = settings.get("overlay_path")
+    if overlay_path:
+        command += ["-thread_queue_size", "512", "-i", overlay_path]
+        command += [
+            "-filter_complex", f"[0:v][{next_input}:v]overlay=0:0,{pad_filter}[v]",
+            "-map", "[v]"
+        ]
+        if audio_path:
+            command += ["-map", f"{audio_input}:a"]
+    else:
+        command += ["-vf", pad_filter]
+
+    if hw_encoder:
+        cq = presets.HW_ENCODER_QUALITIES.get(settings.get("quality"), presets.HW_ENCODER_QUALITIES[presets.DEFAULT_H264_QUALITY])
+        command += ["-c:v", hw_encoder]
+        if hw_encoder.endswith("_nvenc"):
+            # -b:v 0 lifts the default bitrate cap so -cq alone sets the quality
+            command += ["-preset", "p4", "-tune", "hq", "-rc", "vbr", "-cq", str(cq), "-b:v", "0"]
+        elif hw_encoder.endswith("_amf"):
+            command += ["-rc", "cqp", "-qp_i", str(cq), "-qp_p", str(cq)]
+        elif hw_encoder.endswith("_qsv"):
+            command += ["-global_quality", str(cq)]
+        elif hw_encoder.endswith("_videotoolbox"):
+            # VideoToolbox quality runs 1-100, higher is better
+            command += ["-q:v", str(max(1, 100 - cq * 2))]
+        if not cuda_upload:
+            # CUDA frames already carry their format
+            command += ["-pix_fmt", "yuv420p"]
+    elif encoder == "prores":
+        command += [
+            "-c:v", "prores_ks",
+            "-profile:v", str(settings.get("prores_profile", presets.PRORES_PROFILES["ProRes 422 HQ"])),
+            "-pix_fmt", "yuv422p10le"
+        ]
+    else:
+        crf = settings.get("crf")
+        if crf is None:
+            crf = presets.H264_QUALITIES.get(settings.get("quality"), presets.H264_QUALITIES[presets.DEFAULT_H264_QUALITY])
+        command += [
+            "-c:v", "libx265" if encoder == "h265" else "libx264",
+            "-preset", settings.get("preset", presets.DEFAULT_H264_PRESET),
+            "-crf", str(crf),
+            "-pix_fmt", "yuv420p"
+        ]
+        if settings.get("tune"):
+            command += ["-tune", settings["tune"]]
+        if settings.get("bframes") is not None:
+            command += ["-bf", str(settings["bframes"])]
+
+    if threads is not None:
+        # Encoding threads
+        command += ["-threads", str(threads)]
+
+    if audio_path:
+        command += ["-c:a", "aac", "-shortest"]
+
+    command.append(output_path)
+    return command
+
+def encode_with_ffmpeg(input_pattern, output_path, settings, progress_callback=None, total_frames=None,
+                       is_cancelled=None):
+    """
+    Encode an image sequence on disk into a movie.
+
+    Args:
+        input_pattern (str): printf-style sequence pattern (e.g. "name.%04d.png").
+        output_path (str): Path to the output movie.
+        settings (dict): Encoding settings, see build_ffmpeg_command. A
+            "start_number" entry gives the first frame of the sequence.
+        progress_callback (callable): Called with the encoded fraction (0.0-1.0)
+            as ffmpeg reports progress. Needs total_frames.
+        total_frames (int): Number of frames in the sequence.
+        is_cancelled (callable): Checked whenever ffmpeg reports progress; if it
+            returns True, ffmpeg is stopped and the partial movie removed.
+
+    Returns:
+        bool: True if the encode succeeded.
+    """
+    ffmpeg_path = get_ffmpeg_path()
+    if not ffmpeg_path:
+        cmds.warning("ffmpeg not available. Cannot encode playblast.")
+        return False
+
+    input_args = ["-start_number", str(settings.get("start_number", 0)), "-i", input_pattern]
+    command = build_ffmpeg_command(ffmpeg_path, input_args, output_path, settings)
+    if (progress_callback or is_cancelled) and total_frames:
+        # Machine-readable "key=value" progress on stderr instead of the status line
+        command[1:1] = ["-progress", "pipe:2", "-nostats"]
+
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    # stderr is read line by line as it arrives, so it can never fill up and stall ffmpeg
+    stderr_tail = collections.deque(maxlen=100)
+    for raw_line in iter(process.stderr.readline, b""):
+        line = raw_line.decode(errors="replace").rstrip()
+        progress_match = _PROGRESS_LINE_RE.match(line) if total_frames else None
+        if not progress_match:
+            stderr_tail.append(line)
+        elif progress_match.group(1) == "frame":
+            if is_cancelled and is_cancelled():
+                process.terminate()
+                process.stderr.close()
+                process.wait()
+                _remove_partial_output(output_path)
+                cmds.warning("ffmpeg encode cancelled")
+                return False
+            if progress_callback:
+                try:
+                    progress_callback(min(int(progress_match.group(2)) / total_frames, 1.0))
+                except ValueError:
+                    pass
+    process.stderr.close()
+    if process.wait() != 0:
+        error = "\n".join(stderr_tail).strip()
+        cmds.warning(f"ffmpeg error: {error}")
+        return False
+    return True
+
+def start_ffmpeg_pipe(output_path, settings):
+    """
+    Start an ffmpeg process that encodes image frames written to its stdin.
+
+    Frames can be fed with feed_ffmpeg_pipe() while Maya is still capturing,
+    so capture and encode overlap instead of running one after the other.
+
+    Args:
+        output_path (str): Path to the output movie.
+        settings (dict): Encoding settings, see build_ffmpeg_command. An
+            "input_codec" entry names the decoder for the piped images.
+
+    Returns:
+        subprocess.Popen: The running ffmpeg process, or None if ffmpeg is not available.
+    """
+    ffmpeg_path = get_ffmpeg_path()
+    if not ffmpeg_path:
+        return None
+
+    input_args = ["-f", "image2pipe"]
+    if settings.get("input_codec"):
+        # Name the decoder instead of leaving ffmpeg to probe the piped frames
+        input_args += ["-c:v", settings["input_codec"]]
+    input_args += ["-i", "-"]
+    command = build_ffmpeg_command(ffmpeg_path, input_args, output_path, settings)
+    # A 1 MB buffer lets each frame go into the pipe in a few large writes
+    process = subprocess.Popen(
+        command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        bufsize=1 << 20
+    )
+
+    # Keep reading stderr so a chatty ffmpeg can never fill the pipe and stall,
+    # holding on to the last lines for the error report
+    process.stderr_tail = collections.deque(maxlen=100)
+    reader = threading.Thread(target=_read_stderr, args=(process,), daemon=True)
+    reader.start()
+    process.stderr_reader = reader
+    return process
+
+def _read_stderr(process):
+    """Collect the stderr lines of a process started with start_ffmpeg_pipe()."""
+    for line in iter(process.stderr.readline, b""):
+        process.stderr_tail.append(line.decode(errors="replace").rstrip())
+    process.stderr.close()
+
+def feed_ffmpeg_pipe(process, frame_paths, delete=False):
+    """
+    Write image files to a process started with start_ffmpeg_pipe().
+
+    Args:
+        process (subprocess.Popen): The ffmpeg process.
+        frame_paths (list): Image files, in frame order.
+        delete (bool): Remove each file once it has been written to the pipe,
+            so at most one chunk of frames is on disk at a time.
+
+    Returns:
+        bool: False if ffmpeg stopped accepting input.
+    """
+    try:
+        for frame_path in frame_paths:
+            with open(frame_path, "rb") as frame_file:
+                shutil.copyfileobj(frame_file, process.stdin)
+            if delete:
+                os.unlink(frame_path)
+    except (BrokenPipeError, OSError) as e:
+        cmds.warning(f"Could not stream frames to ffmpeg: {e}")
+        return False
+    return True
+
+def wait_ffmpeg_pipe(process):
+    """
+    Close the input of a process started with start_ffmpeg_pipe() and wait for it.
+
+    Runs no Maya commands, so it can be called from a worker thread.
+
+    Args:
+        process (subprocess.Popen): The ffmpeg process.
+
+    Returns:
+        str: The error output if the encode failed, otherwise None.
+    """
+    try:
+        process.stdin.close()
+    except OSError:
+        pass
+    return_code = process.wait()
+    process.stderr_reader.join(timeout=5)
+    if return_code != 0:
+        return "\n".join(process.stderr_tail) or f"exit code {return_code}"
+    return None
+
+def abort_ffmpeg_pipe(process, output_path=None):
+    """
+    Stop a process started with start_ffmpeg_pipe() without finishing the movie.
+
+    Args:
+        process (subprocess.Popen): The ffmpeg process.
+        output_path (str): The movie being written; removed if given.
+    """
+    process.terminate()
+    try:
+        process.stdin.close()
+    except OSError:
+        pass
+    process.wait()
+    process.stderr_reader.join(timeout=5)
+    if output_path:
+        _remove_partial_output(output_path)
+
+def _remove_partial_output(output_path):
+    """Delete what a stopped ffmpeg left behind."""
+    try:
+        os.remove(output_path)
+    except OSError:
+        pass
+
+def finish_ffmpeg_pipe(process):
+    """
+    Close the input of a process started with start_ffmpeg_pipe() and wait for it.
+
+    Args:
+        process (subprocess.Popen): The ffmpeg process.
+
+    Returns:
+        bool: True if the encode succeeded.
+    """
+    error = wait_ffmpeg_pipe(process)
+    if error:
+        cmds.warning(f"ffmpeg error: {error}")
+        return False
+    return True
+
+
+# ===========================================================================
+# FILE UTILITIES
+# ===========================================================================
+
+def show_in_viewer(file_path):
+    """
+    Open a file in the system's default application.
+
+    Goes through Qt in an interactive session. In batch mode, or when Qt is not
+    available, the platform's own opener is used instead.
+
+    Args:
+        file_path (str): File to open.
+
+    Returns:
+        bool: True if the viewer was launched.
+    """
+    if not os.path.exists(file_path):
+        cmds.warning(f"File does not exist: {file_path}")
+        return False
+    if not cmds.about(batch=True):
+        QtGui, QtCore = _import_qt()
+        if QtGui is not None:
+            return QtGui.QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(file_path))
+    try:
+        if sys.platform == "win32":
+            os.startfile(file_path)
+        else:
+            # Detached from Maya's stdio so the opener can never block on it
+            opener = "open" if sys.platform == "darwin" else "xdg-open"
+            subprocess.Popen(
+                [opener, file_path],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                close_fds=True
+            )
+    except OSError as e:
+        cmds.warning(f"Could not open {file_path}: {e}")
+        return False
+    return True
+
+def batch_unlink_tree(path, max_workers=8, keep_dir=False):
+    """
+    Delete a flat directory of files, such as a temporary frame sequence.
+
+    The files are listed with a single os.scandir pass and unlinked in parallel,
+    which matters on network storage where every unlink is a round trip.
+    Anything unexpected (subdirectories, locked files) falls back to
+    shutil.rmtree. Safe to call from a background thread.
+
+    Args:
+        path (str): Directory to delete.
+        max_workers (int): Number of threads unlinking files.
+        keep_dir (bool): Only empty the directory, so it can be reused.
+
+    Returns:
+        bool: True if the directory was emptied (and removed unless keep_dir)
+            without falling back to shutil.rmtree.
+    """
+    import concurrent.futures
+    try:
+        with os.scandir(path) as entries:
+            files = [entry.path for entry in entries if not entry.is_dir(follow_symlinks=False)]
+        if len(files) <= max_workers:
+            # Not worth starting threads for a handful of files
+            for file_path in files:
+                os.unlink(file_path)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(os.unlink, files))
+        if not keep_dir:
+            os.rmdir(path)
+    except FileNotFoundError:
+        return False
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return False
+    return True
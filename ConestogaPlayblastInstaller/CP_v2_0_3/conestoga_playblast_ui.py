@@ -272,6 +272,13 @@ class CPCollapsibleGrpWidget(QtWidgets.QWidget):
 
         self.collapsed_state_changed.emit()  # pylint: disable=E1101
 
+    def sizeHint(self):
+        # Only the header is visible while collapsed, avoid measuring the body
+        if self.is_collapsed():
+            return self.header_wdg.sizeHint()
+
+        return super(CPCollapsibleGrpWidget, self).sizeHint()
+
 
 class CPColorButton(QtWidgets.QWidget):
 
@@ -1697,11 +1704,12 @@ class CPPlayblastWidget(QtWidgets.QWidget):
         button_height = int(19 * scale_value)
         icon_button_width = int(24 * scale_value)
         icon_button_height = int(18 * scale_value)
+        exec_button_height = int(30 * scale_value)
         combo_box_min_width = int(100 * scale_value)
         spin_box_min_width = int(40 * scale_value)
 
         # Create a more modern look with custom styling
-        self.setStyleSheet("""
+        style_sheet = """
             QWidget {
                 background-color: #2D2D30;
                 color: #E6E6E6;
@@ -1741,17 +1749,44 @@ class CPPlayblastWidget(QtWidgets.QWidget):
             QLabel {
                 color: #E6E6E6;
             }
-        """)
+            QPushButton[kind="success"] {
+                background-color: #22883E;
+                font-weight: bold;
+                font-size: 14px;
+            }
+        """
+
+        # Button sizes live in the sheet (not setFixedSize/setFixedHeight) so the
+        # geometry is resolved once when the widgets are polished
+        style_sheet += """
+            QPushButton#icon_btn {{
+                padding: 0px;
+                min-width: {0}px;
+                max-width: {0}px;
+                min-height: {1}px;
+                max-height: {1}px;
+            }}
+            QPushButton#action_btn {{
+                padding: 0px 8px;
+                min-height: {2}px;
+                max-height: {2}px;
+            }}
+            QPushButton#exec_btn {{
+                min-height: {3}px;
+            }}
+        """.format(icon_button_width, icon_button_height, button_height, exec_button_height)
+
+        self.setStyleSheet(style_sheet)
 
         self.output_dir_path_le = CPLineEdit(CPLineEdit.TYPE_PLAYBLAST_OUTPUT_PATH)
         self.output_dir_path_le.setPlaceholderText("{project}/movies")
 
         self.output_dir_path_select_btn = QtWidgets.QPushButton("...")
-        self.output_dir_path_select_btn.setFixedSize(icon_button_width, icon_button_height)
+        self.output_dir_path_select_btn.setObjectName("icon_btn")
         self.output_dir_path_select_btn.setToolTip("Select Output Directory")
 
         self.output_dir_path_show_folder_btn = QtWidgets.QPushButton(QtGui.QIcon(":fileOpen.png"), "")
-        self.output_dir_path_show_folder_btn.setFixedSize(icon_button_width, icon_button_height)
+        self.output_dir_path_show_folder_btn.setObjectName("icon_btn")
         self.output_dir_path_show_folder_btn.setToolTip("Show in Folder")
 
         self.output_filename_le = CPLineEdit(CPLineEdit.TYPE_PLAYBLAST_OUTPUT_FILENAME)
@@ -1759,10 +1794,15 @@ class CPPlayblastWidget(QtWidgets.QWidget):
         self.output_filename_le.setMaximumWidth(int(200 * scale_value))
         self.force_overwrite_cb = QtWidgets.QCheckBox("Force overwrite")
 
+        # Signals are blocked while populating widgets below so that no change
+        # notifications are dispatched before create_connections() runs.
+
         # Name Generator widgets
         self.assignmentSpinBox = QtWidgets.QSpinBox()
+        self.assignmentSpinBox.blockSignals(True)
         self.assignmentSpinBox.setRange(1, 99)
         self.assignmentSpinBox.setValue(1)
+        self.assignmentSpinBox.blockSignals(False)
         self.assignmentSpinBox.setFixedWidth(50)
 
         self.lastnameLineEdit = QtWidgets.QLineEdit()
@@ -1772,11 +1812,15 @@ class CPPlayblastWidget(QtWidgets.QWidget):
         self.firstnameLineEdit.setPlaceholderText("First Name")
 
         self.versionTypeCombo = QtWidgets.QComboBox()
+        self.versionTypeCombo.blockSignals(True)
         self.versionTypeCombo.addItems(["wip", "final"])
+        self.versionTypeCombo.blockSignals(False)
 
         self.versionNumberSpinBox = QtWidgets.QSpinBox()
+        self.versionNumberSpinBox.blockSignals(True)
         self.versionNumberSpinBox.setRange(1, 99)
         self.versionNumberSpinBox.setValue(1)
+        self.versionNumberSpinBox.blockSignals(False)
         self.versionNumberSpinBox.setFixedWidth(50)
 
         self.filenamePreviewLabel = QtWidgets.QLabel("A1_LastName_FirstName_wip_01.mov")
@@ -1789,62 +1833,80 @@ class CPPlayblastWidget(QtWidgets.QWidget):
 
         self.resolution_select_cmb = QtWidgets.QComboBox()
         self.resolution_select_cmb.setMinimumWidth(combo_box_min_width)
+        self.resolution_select_cmb.blockSignals(True)
         self.resolution_select_cmb.addItems(self._playblast.resolution_preset_names)
         self.resolution_select_cmb.addItem("Custom")
         self.resolution_select_cmb.setCurrentText(CPPlayblast.DEFAULT_RESOLUTION)
+        self.resolution_select_cmb.blockSignals(False)
 
         self.resolution_width_sb = QtWidgets.QSpinBox()
         self.resolution_width_sb.setButtonSymbols(QtWidgets.QSpinBox.NoButtons)
+        self.resolution_width_sb.blockSignals(True)
         self.resolution_width_sb.setRange(1, 9999)
+        self.resolution_width_sb.blockSignals(False)
         self.resolution_width_sb.setMinimumWidth(spin_box_min_width)
         self.resolution_width_sb.setAlignment(QtCore.Qt.AlignRight)
         self.resolution_height_sb = QtWidgets.QSpinBox()
         self.resolution_height_sb.setButtonSymbols(QtWidgets.QSpinBox.NoButtons)
+        self.resolution_height_sb.blockSignals(True)
         self.resolution_height_sb.setRange(1, 9999)
+        self.resolution_height_sb.blockSignals(False)
         self.resolution_height_sb.setMinimumWidth(spin_box_min_width)
         self.resolution_height_sb.setAlignment(QtCore.Qt.AlignRight)
 
         self.camera_select_cmb = QtWidgets.QComboBox()
         self.camera_select_cmb.setMinimumWidth(combo_box_min_width)
         self.camera_select_hide_defaults_cb = QtWidgets.QCheckBox("Hide defaults")
-        self.refresh_cameras()
+        self.camera_select_cmb.addItem("<Active>")
+        # Query the scene cameras on the next event loop iteration so the widget can be shown first
+        QtCore.QTimer.singleShot(0, self._collect_and_apply_cameras)
 
         self.frame_range_cmb = QtWidgets.QComboBox()
         self.frame_range_cmb.setMinimumWidth(combo_box_min_width)
+        self.frame_range_cmb.blockSignals(True)
         self.frame_range_cmb.addItems(CPPlayblast.FRAME_RANGE_PRESETS)
         self.frame_range_cmb.addItem("Custom")
         self.frame_range_cmb.setCurrentText(CPPlayblast.DEFAULT_FRAME_RANGE)
+        self.frame_range_cmb.blockSignals(False)
 
         self.frame_range_start_sb = QtWidgets.QSpinBox()
         self.frame_range_start_sb.setButtonSymbols(QtWidgets.QSpinBox.NoButtons)
+        self.frame_range_start_sb.blockSignals(True)
         self.frame_range_start_sb.setRange(-9999, 9999)
+        self.frame_range_start_sb.blockSignals(False)
         self.frame_range_start_sb.setMinimumWidth(spin_box_min_width)
         self.frame_range_start_sb.setAlignment(QtCore.Qt.AlignRight)
 
         self.frame_range_end_sb = QtWidgets.QSpinBox()
         self.frame_range_end_sb.setButtonSymbols(QtWidgets.QSpinBox.NoButtons)
+        self.frame_range_end_sb.blockSignals(True)
         self.frame_range_end_sb.setRange(-9999, 9999)
+        self.frame_range_end_sb.blockSignals(False)
         self.frame_range_end_sb.setMinimumWidth(spin_box_min_width)
         self.frame_range_end_sb.setAlignment(QtCore.Qt.AlignRight)
 
         self.encoding_container_cmb = QtWidgets.QComboBox()
         self.encoding_container_cmb.setMinimumWidth(combo_box_min_width)
+        self.encoding_container_cmb.blockSignals(True)
         self.encoding_container_cmb.addItems(CPPlayblastWidget.CONTAINER_PRESETS)
         self.encoding_container_cmb.setCurrentText(CPPlayblast.DEFAULT_CONTAINER)
+        self.encoding_container_cmb.blockSignals(False)
 
         self.encoding_video_codec_cmb = QtWidgets.QComboBox()
         self.encoding_video_codec_cmb.setMinimumWidth(combo_box_min_width)
         self.encoding_video_codec_settings_btn = QtWidgets.QPushButton("Settings...")
-        self.encoding_video_codec_settings_btn.setFixedHeight(button_height)
+        self.encoding_video_codec_settings_btn.setObjectName("action_btn")
 
         self.visibility_cmb = QtWidgets.QComboBox()
         self.visibility_cmb.setMinimumWidth(combo_box_min_width)
+        self.visibility_cmb.blockSignals(True)
         self.visibility_cmb.addItems(self._playblast.viewport_visibility_preset_names)
         self.visibility_cmb.addItem("Custom")
         self.visibility_cmb.setCurrentText(CPPlayblast.DEFAULT_VISIBILITY)
+        self.visibility_cmb.blockSignals(False)
 
         self.visibility_customize_btn = QtWidgets.QPushButton("Customize...")
-        self.visibility_customize_btn.setFixedHeight(button_height)
+        self.visibility_customize_btn.setObjectName("action_btn")
 
         self.overscan_cb = QtWidgets.QCheckBox("Overscan")
         self.overscan_cb.setChecked(False)
@@ -1868,6 +1930,9 @@ class CPPlayblastWidget(QtWidgets.QWidget):
         self.output_edit.setFocusPolicy(QtCore.Qt.NoFocus)
         self.output_edit.setReadOnly(True)
         self.output_edit.setWordWrapMode(QtGui.QTextOption.NoWrap)
+        self.output_edit.setUndoRedoEnabled(False)
+        self.output_edit.setCenterOnScroll(False)
+        self.output_edit.setMaximumBlockCount(2000)
         self.output_edit.setStyleSheet("background-color: #1E1E1E; color: #CCCCCC; border: 1px solid #3D3D3D;")
 
         self.log_to_script_editor_cb = QtWidgets.QCheckBox("Log to Script Editor")
@@ -1875,16 +1940,12 @@ class CPPlayblastWidget(QtWidgets.QWidget):
 
         self.clear_btn = QtWidgets.QPushButton("Clear")
         self.clear_btn.setMinimumWidth(int(70 * scale_value))
-        self.clear_btn.setFixedHeight(button_height)
+        self.clear_btn.setObjectName("action_btn")
 
         # Create execute button (was missing)
         self.execute_btn = QtWidgets.QPushButton("Create Playblast")
-        self.execute_btn.setMinimumHeight(int(30 * scale_value))
-        self.execute_btn.setStyleSheet("""
-            background-color: #22883E;
-            font-weight: bold;
-            font-size: 14px;
-        """)
+        self.execute_btn.setObjectName("exec_btn")
+        self.execute_btn.setProperty("kind", "success")
 
     def create_layouts(self):
         # Create output path layout with enhanced styling
@@ -1900,60 +1961,43 @@ class CPPlayblastWidget(QtWidgets.QWidget):
         output_file_layout.addWidget(self.output_filename_le)
         output_file_layout.addWidget(self.force_overwrite_cb)
 
-        # Main output section with a cleaner, modern header
+        # Output and name generator sections share a single grid and card frame
         output_header = QtWidgets.QLabel("OUTPUT SETTINGS")
         output_header.setStyleSheet("font-weight: bold; color: #4B94CF; font-size: 13px; padding: 5px;")
-        
-        # Create form layout for output fields with modern spacing
-        output_form = CPFormLayout()
-        output_form.setContentsMargins(8, 8, 8, 12)
-        output_form.setVerticalSpacing(10)
-        output_form.addLayoutRow(0, "Output Dir:", output_path_layout)
-        output_form.addLayoutRow(1, "Filename:", output_file_layout)
-        
-        output_layout = QtWidgets.QVBoxLayout()
-        output_layout.addWidget(output_header)
-        output_layout.addLayout(output_form)
-        
-        # Frame the output section
-        output_frame = QtWidgets.QFrame()
-        output_frame.setLayout(output_layout)
-        output_frame.setStyleSheet("QFrame { background-color: #2A2A2A; border-radius: 5px; }")
-
-        # Create Name Generator section with the same styling approach
-        name_gen_header = QtWidgets.QLabel("NAME GENERATOR")
-        name_gen_header.setStyleSheet("font-weight: bold; color: #4B94CF; font-size: 13px; padding: 5px;")
-        
-        # Create grid layout for name generator fields
-        name_gen_grid = QtWidgets.QGridLayout()
-        name_gen_grid.setColumnStretch(2, 1)  # Make the third column stretch
-        name_gen_grid.setVerticalSpacing(8)
-        name_gen_grid.setContentsMargins(8, 8, 8, 8)
-        
-        # Assignment field
-        name_gen_grid.addWidget(QtWidgets.QLabel("Assignment:"), 0, 0)
-        name_gen_grid.addWidget(self.assignmentSpinBox, 0, 1)
-        
-        # Last Name field
-        name_gen_grid.addWidget(QtWidgets.QLabel("Last Name:"), 1, 0)
-        name_gen_grid.addWidget(self.lastnameLineEdit, 1, 1, 1, 2)
-        
-        # First Name field
-        name_gen_grid.addWidget(QtWidgets.QLabel("First Name:"), 2, 0)
-        name_gen_grid.addWidget(self.firstnameLineEdit, 2, 1, 1, 2)
-        
-        # Version type dropdown
-        name_gen_grid.addWidget(QtWidgets.QLabel("Type:"), 3, 0)
-        name_gen_grid.addWidget(self.versionTypeCombo, 3, 1)
-        
-        # Version number
-        name_gen_grid.addWidget(QtWidgets.QLabel("Version:"), 4, 0)
-        name_gen_grid.addWidget(self.versionNumberSpinBox, 4, 1)
-        
-        # Preview field
-        name_gen_grid.addWidget(QtWidgets.QLabel("Preview:"), 5, 0)
-        name_gen_grid.addWidget(self.filenamePreviewLabel, 5, 1, 1, 2)
-        
+
+        unified_grid = QtWidgets.QGridLayout()
+        unified_grid.setContentsMargins(8, 8, 8, 8)
+        unified_grid.setColumnMinimumWidth(0, 80)
+        unified_grid.setColumnStretch(2, 1)  # Make the third column stretch
+        unified_grid.setHorizontalSpacing(6)
+        unified_grid.setVerticalSpacing(8)
+
+        # Output fields
+        unified_grid.addWidget(QtWidgets.QLabel("Output Dir:"), 0, 0, QtCore.Qt.AlignRight)
+        unified_grid.addLayout(output_path_layout, 0, 1, 1, 2)
+
+        unified_grid.addWidget(QtWidgets.QLabel("Filename:"), 1, 0, QtCore.Qt.AlignRight)
+        unified_grid.addLayout(output_file_layout, 1, 1, 1, 2)
+
+        # Name generator fields
+        unified_grid.addWidget(QtWidgets.QLabel("Assignment:"), 2, 0, QtCore.Qt.AlignRight)
+        unified_grid.addWidget(self.assignmentSpinBox, 2, 1)
+
+        unified_grid.addWidget(QtWidgets.QLabel("Last Name:"), 3, 0, QtCore.Qt.AlignRight)
+        unified_grid.addWidget(self.lastnameLineEdit, 3, 1, 1, 2)
+
+        unified_grid.addWidget(QtWidgets.QLabel("First Name:"), 4, 0, QtCore.Qt.AlignRight)
+        unified_grid.addWidget(self.firstnameLineEdit, 4, 1, 1, 2)
+
+        unified_grid.addWidget(QtWidgets.QLabel("Type:"), 5, 0, QtCore.Qt.AlignRight)
+        unified_grid.addWidget(self.versionTypeCombo, 5, 1)
+
+        unified_grid.addWidget(QtWidgets.QLabel("Version:"), 6, 0, QtCore.Qt.AlignRight)
+        unified_grid.addWidget(self.versionNumberSpinBox, 6, 1)
+
+        unified_grid.addWidget(QtWidgets.QLabel("Preview:"), 7, 0, QtCore.Qt.AlignRight)
+        unified_grid.addWidget(self.filenamePreviewLabel, 7, 1, 1, 2)
+
         # Generate and Reset buttons side by side with a modern layout
         generate_btn_layout = QtWidgets.QHBoxLayout()
         generate_btn_layout.setContentsMargins(0, 10, 0, 0)
@@ -1962,16 +2006,16 @@ class CPPlayblastWidget(QtWidgets.QWidget):
         generate_btn_layout.addSpacing(8)
         generate_btn_layout.addWidget(self.resetNameGeneratorButton)
         generate_btn_layout.addStretch()
-        
-        name_gen_layout = QtWidgets.QVBoxLayout()
-        name_gen_layout.addWidget(name_gen_header)
-        name_gen_layout.addLayout(name_gen_grid)
-        name_gen_layout.addLayout(generate_btn_layout)
-        
-        # Frame the name generator section
-        name_gen_frame = QtWidgets.QFrame()
-        name_gen_frame.setLayout(name_gen_layout)
-        name_gen_frame.setStyleSheet("QFrame { background-color: #2A2A2A; border-radius: 5px; }")
+
+        combined_layout = QtWidgets.QVBoxLayout()
+        combined_layout.addWidget(output_header)
+        combined_layout.addLayout(unified_grid)
+        combined_layout.addLayout(generate_btn_layout)
+
+        # Frame the combined output/name generator section
+        combined_frame = QtWidgets.QFrame()
+        combined_frame.setLayout(combined_layout)
+        combined_frame.setStyleSheet("QFrame { background-color: #2A2A2A; border-radius: 5px; }")
 
         # Options Section - Redesigned with card-based layout
         options_header = QtWidgets.QLabel("PLAYBLAST OPTIONS")
@@ -1981,9 +2025,6 @@ class CPPlayblastWidget(QtWidgets.QWidget):
         camera_card = QtWidgets.QFrame()
         camera_card.setStyleSheet("QFrame { background-color: #323232; border-radius: 4px; margin: 2px; }")
         
-        camera_title = QtWidgets.QLabel("Camera")
-        camera_title.setStyleSheet("font-weight: bold; color: #CCCCCC; padding-left: 5px;")
-        
         camera_options_layout = QtWidgets.QHBoxLayout()
         camera_options_layout.setSpacing(6)
         camera_options_layout.addWidget(self.camera_select_cmb)
@@ -1992,16 +2033,12 @@ class CPPlayblastWidget(QtWidgets.QWidget):
         
         camera_layout = QtWidgets.QVBoxLayout(camera_card)
         camera_layout.setContentsMargins(10, 8, 10, 8)
-        camera_layout.addWidget(camera_title)
         camera_layout.addLayout(camera_options_layout)
 
         # Resolution card
         resolution_card = QtWidgets.QFrame()
         resolution_card.setStyleSheet("QFrame { background-color: #323232; border-radius: 4px; margin: 2px; }")
         
-        resolution_title = QtWidgets.QLabel("Resolution")
-        resolution_title.setStyleSheet("font-weight: bold; color: #CCCCCC; padding-left: 5px;")
-        
         resolution_layout = QtWidgets.QHBoxLayout()
         resolution_layout.setSpacing(4)
         resolution_layout.addWidget(self.resolution_select_cmb)
@@ -2013,16 +2050,12 @@ class CPPlayblastWidget(QtWidgets.QWidget):
         
         resolution_card_layout = QtWidgets.QVBoxLayout(resolution_card)
         resolution_card_layout.setContentsMargins(10, 8, 10, 8)
-        resolution_card_layout.addWidget(resolution_title)
         resolution_card_layout.addLayout(resolution_layout)
 
         # Frame Range card
         frame_range_card = QtWidgets.QFrame()
         frame_range_card.setStyleSheet("QFrame { background-color: #323232; border-radius: 4px; margin: 2px; }")
         
-        frame_range_title = QtWidgets.QLabel("Frame Range")
-        frame_range_title.setStyleSheet("font-weight: bold; color: #CCCCCC; padding-left: 5px;")
-        
         frame_range_layout = QtWidgets.QHBoxLayout()
         frame_range_layout.setSpacing(4)
         frame_range_layout.addWidget(self.frame_range_cmb)
@@ -2033,16 +2066,12 @@ class CPPlayblastWidget(QtWidgets.QWidget):
         
         frame_range_card_layout = QtWidgets.QVBoxLayout(frame_range_card)
         frame_range_card_layout.setContentsMargins(10, 8, 10, 8)
-        frame_range_card_layout.addWidget(frame_range_title)
         frame_range_card_layout.addLayout(frame_range_layout)
 
         # Encoding card
         encoding_card = QtWidgets.QFrame()
         encoding_card.setStyleSheet("QFrame { background-color: #323232; border-radius: 4px; margin: 2px; }")
         
-        encoding_title = QtWidgets.QLabel("Encoding")
-        encoding_title.setStyleSheet("font-weight: bold; color: #CCCCCC; padding-left: 5px;")
-        
         encoding_layout = QtWidgets.QHBoxLayout()
         encoding_layout.setSpacing(2)
         encoding_layout.addWidget(self.encoding_container_cmb)
@@ -2052,16 +2081,12 @@ class CPPlayblastWidget(QtWidgets.QWidget):
         
         encoding_card_layout = QtWidgets.QVBoxLayout(encoding_card)
         encoding_card_layout.setContentsMargins(10, 8, 10, 8)
-        encoding_card_layout.addWidget(encoding_title)
         encoding_card_layout.addLayout(encoding_layout)
 
         # Visibility card
         visibility_card = QtWidgets.QFrame()
         visibility_card.setStyleSheet("QFrame { background-color: #323232; border-radius: 4px; margin: 2px; }")
         
-        visibility_title = QtWidgets.QLabel("Visibility")
-        visibility_title.setStyleSheet("font-weight: bold; color: #CCCCCC; padding-left: 5px;")
-        
         visibility_layout = QtWidgets.QHBoxLayout()
         visibility_layout.setSpacing(4)
         visibility_layout.addWidget(self.visibility_cmb)
@@ -2070,16 +2095,12 @@ class CPPlayblastWidget(QtWidgets.QWidget):
         
         visibility_card_layout = QtWidgets.QVBoxLayout(visibility_card)
         visibility_card_layout.setContentsMargins(10, 8, 10, 8)
-        visibility_card_layout.addWidget(visibility_title)
         visibility_card_layout.addLayout(visibility_layout)
 
         # Checkbox options with a modern grid approach
         options_checkboxes_card = QtWidgets.QFrame()
         options_checkboxes_card.setStyleSheet("QFrame { background-color: #323232; border-radius: 4px; margin: 2px; }")
         
-        checkboxes_title = QtWidgets.QLabel("Additional Options")
-        checkboxes_title.setStyleSheet("font-weight: bold; color: #CCCCCC; padding-left: 5px;")
-        
         checkbox_grid = QtWidgets.QGridLayout()
         checkbox_grid.addWidget(self.ornaments_cb, 0, 0)
         checkbox_grid.addWidget(self.overscan_cb, 0, 1)
@@ -2090,18 +2111,29 @@ class CPPlayblastWidget(QtWidgets.QWidget):
         
         options_checkboxes_layout = QtWidgets.QVBoxLayout(options_checkboxes_card)
         options_checkboxes_layout.setContentsMargins(10, 8, 10, 8)
-        options_checkboxes_layout.addWidget(checkboxes_title)
         options_checkboxes_layout.addLayout(checkbox_grid)
 
-        # Layout all option cards in a vertical flow
+        # Each option card lives in a collapsible group. Only one group is expanded
+        # at a time so collapsed cards are skipped during layout.
+        self.option_groups = []
+        for title, card in [("Camera", camera_card),
+                            ("Resolution", resolution_card),
+                            ("Frame Range", frame_range_card),
+                            ("Encoding", encoding_card),
+                            ("Visibility", visibility_card),
+                            ("Additional Options", options_checkboxes_card)]:
+            group = CPCollapsibleGrpWidget(title)
+            group.add_widget(card)
+            group.set_collapsed(bool(self.option_groups))
+            group.collapsed_state_changed.connect(partial(self.on_option_group_collapsed_state_changed, group))
+
+            self.option_groups.append(group)
+
+        # Layout all option groups in a vertical flow
         options_cards_layout = QtWidgets.QVBoxLayout()
         options_cards_layout.setSpacing(8)
-        options_cards_layout.addWidget(camera_card)
-        options_cards_layout.addWidget(resolution_card)
-        options_cards_layout.addWidget(frame_range_card)
-        options_cards_layout.addWidget(encoding_card)
-        options_cards_layout.addWidget(visibility_card)
-        options_cards_layout.addWidget(options_checkboxes_card)
+        for group in self.option_groups:
+            options_cards_layout.addWidget(group)
         
         options_layout = QtWidgets.QVBoxLayout()
         options_layout.addWidget(options_header)
@@ -2141,8 +2173,57 @@ class CPPlayblastWidget(QtWidgets.QWidget):
         main_layout = QtWidgets.QVBoxLayout(self)
         main_layout.setContentsMargins(10, 10, 10, 10)
         main_layout.setSpacing(10)
-        main_layout.addWidget(output_frame)
-        main_layout.addWidget(name_gen_frame)
+        main_layout.addWidget(combined_frame)
         main_layout.addWidget(options_frame)
         main_layout.addLayout(execute_layout)
-        main_layout.addWidget(logging_frame)
\ No newline at end of file
+        main_layout.addWidget(logging_frame)
+
+    def create_connections(self):
+        self._playblast.output_logged.connect(self.append_output)  # pylint: disable=E1101
+
+        self.clear_btn.clicked.connect(self.output_edit.clear)
+
+    def on_option_group_collapsed_state_changed(self, group):
+        if group.is_expanded():
+            for other_group in self.option_groups:
+                if other_group is not group:
+                    other_group.set_collapsed(True)
+
+        self.collapsed_state_changed.emit()  # pylint: disable=E1101
+
+    def append_output(self, text):
+        self.output_edit.setUpdatesEnabled(False)
+
+        cursor = self.output_edit.textCursor()
+        cursor.movePosition(QtGui.QTextCursor.End)
+        if not self.output_edit.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(text)
+        self.output_edit.setTextCursor(cursor)
+
+        self.output_edit.setUpdatesEnabled(True)
+
+    def refresh_cameras(self):
+        self._apply_camera_names(self._collect_camera_names())
+
+    def _collect_camera_names(self):
+        return CPPlayblastUtils.cameras_in_scene(not self.camera_select_hide_defaults_cb.isChecked(), True)
+
+    def _apply_camera_names(self, names, current_camera=None):
+        if current_camera is None:
+            current_camera = self.camera_select_cmb.currentText()
+
+        self.camera_select_cmb.clear()
+
+        self.camera_select_cmb.addItem("<Active>")
+        self.camera_select_cmb.addItems(names)
+
+        self.camera_select_cmb.setCurrentText(current_camera)
+
+    def _collect_and_apply_cameras(self):
+        # The saved camera could not be selected while the list was still empty
+        current_camera = CPPlayblastUtils.get_opt_var_str(CPPlayblastWidget.OPT_VAR_CAMERA)
+        if not current_camera:
+            current_camera = self.camera_select_cmb.currentText()
+
+        self._apply_camera_names(self._collect_camera_names(), current_camera)
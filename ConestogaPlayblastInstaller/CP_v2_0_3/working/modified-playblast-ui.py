@@ -5,6 +5,13 @@ class CPPlayblastUi(QtWidgets.QWidget):
 
     OPT_VAR_GROUP_STATE = "cpPlayblastGroupState"
 
+    CAMERA_LIST_DIRTY_EVENTS = [
+        "SceneOpened",
+        "NewSceneOpened",
+        "DagObjectCreated",
+        "NameChanged",
+    ]
+
     ui_instance = None
 
 
@@ -28,6 +35,10 @@ class CPPlayblastUi(QtWidgets.QWidget):
         self.setMinimumWidth(int(400 * CPPlayblastUtils.dpi_real_scale_value()))
 
         self._batch_playblast_dialog = None
+        self._camera_list_dirty = True
+        self._is_focus_window = False
+        self._script_job_ids = []
+        self._callback_ids = []
 
         self.create_widgets()
         self.create_layouts()
@@ -37,7 +48,7 @@ class CPPlayblastUi(QtWidgets.QWidget):
         self.main_tab_wdg.setCurrentIndex(0)
         
         # Apply modern styling
-        self.setStyleSheet("""
+        style_sheet = """
             QTabWidget::pane {
                 border: none;
                 background-color: #2D2D30;
@@ -71,23 +82,50 @@ class CPPlayblastUi(QtWidgets.QWidget):
             QPushButton:pressed {
                 background-color: #2C5A8A;
             }
-        """)
+            QPushButton[kind="info"] {
+                background-color: #2980B9;
+            }
+            QPushButton[kind="success"] {
+                background-color: #27AE60;
+            }
+        """
 
-    def create_widgets(self):
+        # Button sizes live in the sheet (not setFixedSize/setMinimumSize) so the
+        # geometry is resolved once when the widgets are polished
         scale_value = CPPlayblastUtils.dpi_real_scale_value()
         button_width = int(120 * scale_value)
         button_height = int(40 * scale_value)
         batch_button_width = int(40 * scale_value)
 
+        style_sheet += """
+            QPushButton#mask_btn, QPushButton#playblast_btn, QPushButton#batch_btn {{
+                padding: 0px 16px;
+                min-height: {1}px;
+                max-height: {1}px;
+            }}
+            QPushButton#mask_btn {{
+                min-width: {0}px;
+                max-width: {0}px;
+            }}
+            QPushButton#playblast_btn {{
+                min-width: {0}px;
+            }}
+            QPushButton#batch_btn {{
+                padding: 0px;
+                min-width: {2}px;
+                max-width: {2}px;
+            }}
+        """.format(button_width, button_height, batch_button_width)
+
+        self.setStyleSheet(style_sheet)
+
+    def create_widgets(self):
+        scale_value = CPPlayblastUtils.dpi_real_scale_value()
+
+        # The playblast options are collapsible groups, so no scroll area is needed
         self.playblast_wdg = CPPlayblastWidget()
         self.playblast_wdg.setAutoFillBackground(True)
 
-        playblast_scroll_area = QtWidgets.QScrollArea()
-        playblast_scroll_area.setFrameShape(QtWidgets.QFrame.NoFrame)
-        playblast_scroll_area.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        playblast_scroll_area.setWidgetResizable(True)
-        playblast_scroll_area.setWidget(self.playblast_wdg)
-
         self.shot_mask_wdg = CPShotMaskWidget()
         self.shot_mask_wdg.setAutoFillBackground(True)
 
@@ -110,7 +148,7 @@ class CPPlayblastUi(QtWidgets.QWidget):
         self.main_tab_wdg.setAutoFillBackground(True)
         self.main_tab_wdg.setStyleSheet("QTabWidget::pane { border: 0; }")
         self.main_tab_wdg.setMinimumHeight(int(200 * scale_value))
-        self.main_tab_wdg.addTab(playblast_scroll_area, "Playblast")
+        self.main_tab_wdg.addTab(self.playblast_wdg, "Playblast")
         self.main_tab_wdg.addTab(shot_mask_scroll_area, "Shot Mask")
         self.main_tab_wdg.addTab(settings_scroll_area, "Settings")
 
@@ -120,16 +158,16 @@ class CPPlayblastUi(QtWidgets.QWidget):
 
         # Create action buttons with modern styling
         self.toggle_mask_btn = QtWidgets.QPushButton("Shot Mask")
-        self.toggle_mask_btn.setFixedSize(button_width, button_height)
-        self.toggle_mask_btn.setStyleSheet("background-color: #2980B9;")
+        self.toggle_mask_btn.setObjectName("mask_btn")
+        self.toggle_mask_btn.setProperty("kind", "info")
 
         self.playblast_btn = QtWidgets.QPushButton("Playblast")
-        self.playblast_btn.setMinimumSize(button_width, button_height)
-        self.playblast_btn.setStyleSheet("background-color: #27AE60;")
+        self.playblast_btn.setObjectName("playblast_btn")
+        self.playblast_btn.setProperty("kind", "success")
 
         self.batch_playblast_btn = QtWidgets.QPushButton("...")
-        self.batch_playblast_btn.setFixedSize(batch_button_width, button_height)
-        self.batch_playblast_btn.setStyleSheet("background-color: #27AE60;")
+        self.batch_playblast_btn.setObjectName("batch_btn")
+        self.batch_playblast_btn.setProperty("kind", "success")
 
         font = self.toggle_mask_btn.font()
         font.setPointSize(10)
@@ -181,6 +219,10 @@ class CPPlayblastUi(QtWidgets.QWidget):
         self.playblast_btn.clicked.connect(self.playblast_wdg.do_playblast)
         self.batch_playblast_btn.clicked.connect(self.show_batch_playblast_dialog)
 
+        # Only window focus changes are of interest, so listen for those instead of
+        # overriding event() and routing every Qt event through Python
+        QtGui.QGuiApplication.instance().focusWindowChanged.connect(self.on_focus_window_changed)
+
     def create_workspace_control(self):
         self.workspace_control_instance = CPWorkspaceControl(self.get_workspace_control_name())
         if self.workspace_control_instance.exists():
@@ -188,6 +230,46 @@ class CPPlayblastUi(QtWidgets.QWidget):
         else:
             self.workspace_control_instance.create(self.WINDOW_TITLE, self, ui_script="from cp_playblast_ui import CPPlayblastUi\nCPPlayblastUi.display()")
 
+    def create_script_jobs(self):
+        # Parented to the workspace control so Maya kills them if it is deleted
+        parent = self.get_workspace_control_name()
+        self._script_job_ids = []
+        for event in CPPlayblastUi.CAMERA_LIST_DIRTY_EVENTS:
+            self._script_job_ids.append(cmds.scriptJob(event=[event, self.on_camera_list_changed], parent=parent))
+
+        # There is no scriptJob event for deleted nodes
+        self._callback_ids = [om.MDGMessage.addNodeRemovedCallback(self.on_camera_removed, "camera")]
+
+    def delete_script_jobs(self):
+        for job_id in self._script_job_ids:
+            if cmds.scriptJob(exists=job_id):
+                cmds.scriptJob(kill=job_id, force=True)
+
+        self._script_job_ids = []
+
+        if self._callback_ids:
+            om.MMessage.removeCallbacks(self._callback_ids)
+            self._callback_ids = []
+
+    def on_camera_list_changed(self):
+        self._camera_list_dirty = True
+
+    def on_camera_removed(self, node, client_data):
+        self._camera_list_dirty = True
+
+    def showEvent(self, e):
+        super(CPPlayblastUi, self).showEvent(e)
+
+        # The jobs only run while the UI is shown, so anything may have changed
+        self._camera_list_dirty = True
+        if not self._script_job_ids:
+            self.create_script_jobs()
+
+    def hideEvent(self, e):
+        super(CPPlayblastUi, self).hideEvent(e)
+
+        self.delete_script_jobs()
+
     def show_batch_playblast_dialog(self):
         if not self._batch_playblast_dialog:
             self._batch_playblast_dialog = CPCameraSelectDialog(self)
@@ -201,7 +283,10 @@ class CPPlayblastUi(QtWidgets.QWidget):
         else:
             selected = self._batch_playblast_dialog.get_selected()
 
-        self._batch_playblast_dialog.refresh_list(selected=selected)
+        # The camera list only needs to be rebuilt after the scene has changed
+        if self._camera_list_dirty:
+            self._batch_playblast_dialog.refresh_list(selected=selected)
+            self._camera_list_dirty = False
 
         self._batch_playblast_dialog.show()
 
@@ -219,16 +304,18 @@ class CPPlayblastUi(QtWidgets.QWidget):
     def keyPressEvent(self, e):
         pass
 
-    def event(self, e):
-        if e.type() == QtCore.QEvent.WindowActivate:
-            if self.playblast_wdg.isVisible():
-                self.playblast_wdg.refresh_all()
+    def on_focus_window_changed(self, window):
+        is_focus_window = window is not None and window == self.window().windowHandle()
+        if is_focus_window == self._is_focus_window:
+            return
 
-        elif e.type() == QtCore.QEvent.WindowDeactivate:
-            if self.playblast_wdg.isVisible():
-                self.playblast_wdg.save_settings()
+        self._is_focus_window = is_focus_window
 
-        return super(CPPlayblastUi, self).event(e)
+        if self.playblast_wdg.isVisible():
+            if is_focus_window:
+                self.playblast_wdg.refresh_all()
+            else:
+                self.playblast_wdg.save_settings()
 
 
 if __name__ == "__main__":
@@ -5,7 +5,14 @@ This module provides the user interface for the Conestoga Playblast Tool.
 
 import os
 import sys
+import types
+import weakref
+import functools
+import importlib
+import importlib.util
 import maya.cmds as cmds
+import maya.mel as mel
+import maya.api.OpenMaya as om
 
 # Add script directory to path if needed
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -15,16 +22,111 @@ if script_dir not in sys.path:
 import conestoga_playblast_presets as presets
 import conestoga_playblast_utils as utils
 
-# Try to import Qt frameworks based on Maya version
-try:
-    from PySide6 import QtWidgets, QtCore, QtGui
-except ImportError:
-    try:
-        from PySide2 import QtWidgets, QtCore, QtGui
-    except ImportError:
-        from PySide import QtWidgets, QtCore, QtGui
+def _resolve_qt():
+    """
+    Import the Qt framework for this Maya version once per session.
+    
+    The result is kept in sys.modules, so reloading this module does not probe
+    the missing bindings again.
+    
+    Returns:
+        tuple: (QtWidgets, QtCore, QtGui)
+    """
+    qt = sys.modules.get("_conestoga_qt")
+    if qt is None:
+        # Pick the Qt framework for this Maya version without importing the missing ones
+        binding = next(
+            (name for name in ("PySide6", "PySide2", "PySide") if importlib.util.find_spec(name)),
+            None
+        )
+        if binding is None:
+            raise ImportError("No PySide Qt binding found")
+        qt = types.ModuleType("_conestoga_qt")
+        for module_name in ("QtWidgets", "QtCore", "QtGui"):
+            setattr(qt, module_name, importlib.import_module(f"{binding}.{module_name}"))
+        sys.modules["_conestoga_qt"] = qt
+    return qt.QtWidgets, qt.QtCore, qt.QtGui
+
+QtWidgets, QtCore, QtGui = _resolve_qt()
+
+# Login name shown in the shot mask; it cannot change during a session
+_CURRENT_USER = os.environ.get("USER") or os.environ.get("USERNAME") or "user"
+
+# Combo box entries, materialized once
+_RESOLUTION_KEYS = tuple(presets.RESOLUTION_PRESETS)
+_OUTPUT_FORMATS = tuple(presets.OUTPUT_FORMATS)
+_H264_QUALITY_KEYS = tuple(presets.H264_QUALITIES)
+_PRORES_KEYS = tuple(getattr(presets, "PRORES_PROFILES", ()))
+_VIDEO_ENCODER_KEYS = {name: tuple(encoders) for name, encoders in presets.VIDEO_ENCODERS.items()}
+_FRAME_RANGE_KEYS = ("Playback", "Animation", "Render", "Camera", "Custom")
+
+# MEL queries for each frame range preset's (start, end); Camera and Custom keep the fields
+_FRAME_RANGE_QUERIES = {
+    "Playback": ("playbackOptions -q -minTime", "playbackOptions -q -maxTime"),
+    "Animation": ("playbackOptions -q -animationStartTime", "playbackOptions -q -animationEndTime"),
+    "Render": ("getAttr defaultRenderGlobals.startFrame", "getAttr defaultRenderGlobals.endFrame"),
+}
+
+# Item models for the combo boxes whose entries never change, shared by every dialog
+_shared_models = {}
+
+def _get_shared_model(items):
+    """Get the one QStringListModel holding the given entries."""
+    model = _shared_models.get(items)
+    if model is None:
+        model = _shared_models[items] = QtCore.QStringListModel(list(items))
+    return model
+
+@functools.lru_cache(maxsize=None)
+def _playblast_module():
+    """Import conestoga_playblast on first use; it in turn imports this module."""
+    import conestoga_playblast
+    return conestoga_playblast
+
+def _mel_query_pair(first, second):
+    """
+    Run two MEL queries in a single mel.eval round trip.
+    
+    Args:
+        first (str): MEL command returning a number.
+        second (str): MEL command returning a number.
+        
+    Returns:
+        tuple: Both results as ints.
+    """
+    result = mel.eval(f'"" + `{first}` + ";" + `{second}`')
+    first_value, second_value = result.split(";")
+    return int(round(float(first_value))), int(round(float(second_value)))
+
+class RangeSpinBox(QtWidgets.QSpinBox):
+    """Spin box whose range comes from the class, set once at construction."""
+    MINIMUM = -9999
+    MAXIMUM = 9999
+    
+    def __init__(self, value=0, parent=None):
+        super(RangeSpinBox, self).__init__(parent)
+        self.setRange(self.MINIMUM, self.MAXIMUM)
+        if value:
+            self.setValue(value)
+
+class FrameSpinBox(RangeSpinBox):
+    """Spin box for a frame number."""
+
+class ResolutionSpinBox(RangeSpinBox):
+    """Spin box for an image width or height in pixels."""
+    MINIMUM = 1
 
 class PlayblastDialog(QtWidgets.QDialog):
+    # Shot mask text fields: (attribute prefix, label, default text)
+    SHOT_MASK_FIELDS = (
+        ("topLeft", "Top Left:", "Scene: {scene}"),
+        ("topCenter", "Top Center:", ""),
+        ("topRight", "Top Right:", "FPS: {fps}"),
+        ("bottomLeft", "Bottom Left:", "Artist: {username}"),
+        ("bottomCenter", "Bottom Center:", "Date: {date}"),
+        ("bottomRight", "Bottom Right:", "Frame: {counter}"),
+    )
+    
     def __init__(self, parent=None):
         super(PlayblastDialog, self).__init__(parent)
         
@@ -33,6 +135,16 @@ class PlayblastDialog(QtWidgets.QDialog):
         self.setMinimumHeight(600)
         self.setObjectName("ConestoPlayblastDialog")
         
+        # Maya query results, kept until a scene is created or opened
+        self._camera_cache = None
+        self._workspace_root = None
+        self._scene_callback_ids = []
+        self._add_scene_callbacks()
+        # Set when a scene changes while the dialog is hidden
+        self._ui_stale = False
+        # Built on the first Reset click
+        self._reset_confirm = None
+        
         self.create_widgets()
         self.create_layouts()
         self.create_connections()
@@ -56,71 +168,44 @@ class PlayblastDialog(QtWidgets.QDialog):
         
         # Resolution settings
         self.resolution_group = QtWidgets.QGroupBox("Resolution")
-        self.resolution_label = QtWidgets.QLabel("Preset:")
         self.resolution_combo = QtWidgets.QComboBox()
-        for preset in presets.RESOLUTION_PRESETS:
-            self.resolution_combo.addItem(preset)
+        self.resolution_combo.setModel(_get_shared_model(_RESOLUTION_KEYS))
         
-        self.width_label = QtWidgets.QLabel("Width:")
-        self.width_field = QtWidgets.QSpinBox()
-        self.width_field.setRange(1, 9999)
-        self.width_field.setValue(1920)
+        self.width_field = ResolutionSpinBox(1920)
         
-        self.height_label = QtWidgets.QLabel("Height:")
-        self.height_field = QtWidgets.QSpinBox()
-        self.height_field.setRange(1, 9999)
-        self.height_field.setValue(1080)
+        self.height_field = ResolutionSpinBox(1080)
         
         # Frame range settings
         self.frame_range_group = QtWidgets.QGroupBox("Frame Range")
-        self.frame_range_label = QtWidgets.QLabel("Preset:")
         self.frame_range_combo = QtWidgets.QComboBox()
-        self.frame_range_combo.addItems(["Playback", "Animation", "Render", "Camera", "Custom"])
+        self.frame_range_combo.setModel(_get_shared_model(_FRAME_RANGE_KEYS))
         
-        self.start_frame_label = QtWidgets.QLabel("Start:")
-        self.start_frame_field = QtWidgets.QSpinBox()
-        self.start_frame_field.setRange(-9999, 9999)
+        self.start_frame_field = FrameSpinBox()
         
-        self.end_frame_label = QtWidgets.QLabel("End:")
-        self.end_frame_field = QtWidgets.QSpinBox()
-        self.end_frame_field.setRange(-9999, 9999)
+        self.end_frame_field = FrameSpinBox()
         
         # Format settings
         self.format_group = QtWidgets.QGroupBox("Format")
-        self.format_label = QtWidgets.QLabel("Format:")
         self.format_combo = QtWidgets.QComboBox()
-        self.format_combo.addItems(presets.OUTPUT_FORMATS)
+        self.format_combo.setModel(_get_shared_model(_OUTPUT_FORMATS))
         
-        self.encoder_label = QtWidgets.QLabel("Encoder:")
+        # The encoder and quality lists are swapped whole through their own models
+        self._encoder_model = QtCore.QStringListModel()
         self.encoder_combo = QtWidgets.QComboBox()
+        self.encoder_combo.setModel(self._encoder_model)
         
-        self.quality_label = QtWidgets.QLabel("Quality:")
+        self._quality_model = QtCore.QStringListModel(list(_H264_QUALITY_KEYS))
         self.quality_combo = QtWidgets.QComboBox()
-        self.quality_combo.addItems(list(presets.H264_QUALITIES.keys()))
+        self.quality_combo.setModel(self._quality_model)
         
         # Shot mask settings
         self.shot_mask_group = QtWidgets.QGroupBox("Shot Mask")
         self.shot_mask_checkbox = QtWidgets.QCheckBox("Enable Shot Mask")
         self.shot_mask_checkbox.setChecked(True)
-        
-        # Create shot mask text input fields
-        self.topLeftLabel = QtWidgets.QLabel("Top Left:")
-        self.topLeftLineEdit = QtWidgets.QLineEdit("Scene: {scene}")
-        
-        self.topCenterLabel = QtWidgets.QLabel("Top Center:")
-        self.topCenterLineEdit = QtWidgets.QLineEdit("")
-        
-        self.topRightLabel = QtWidgets.QLabel("Top Right:")
-        self.topRightLineEdit = QtWidgets.QLineEdit("FPS: {fps}")
-        
-        self.bottomLeftLabel = QtWidgets.QLabel("Bottom Left:")
-        self.bottomLeftLineEdit = QtWidgets.QLineEdit("Artist: {username}")
-        
-        self.bottomCenterLabel = QtWidgets.QLabel("Bottom Center:")
-        self.bottomCenterLineEdit = QtWidgets.QLineEdit("Date: {date}")
-        
-        self.bottomRightLabel = QtWidgets.QLabel("Bottom Right:")
-        self.bottomRightLineEdit = QtWidgets.QLineEdit("Frame: {counter}")
+        # The text fields are built by create_shot_mask_widgets() when first needed
+        self._shot_mask_built = False
+        # Holds the text fields so enabling the mask is a single setEnabled call
+        self.shot_mask_body = QtWidgets.QWidget()
         
         # Additional options
         self.options_group = QtWidgets.QGroupBox("Options")
@@ -152,51 +237,33 @@ class PlayblastDialog(QtWidgets.QDialog):
         self.camera_group.setLayout(camera_layout)
         
         # Resolution group layout
-        resolution_layout = QtWidgets.QGridLayout()
-        resolution_layout.addWidget(self.resolution_label, 0, 0)
-        resolution_layout.addWidget(self.resolution_combo, 0, 1)
-        resolution_layout.addWidget(self.width_label, 1, 0)
-        resolution_layout.addWidget(self.width_field, 1, 1)
-        resolution_layout.addWidget(self.height_label, 2, 0)
-        resolution_layout.addWidget(self.height_field, 2, 1)
+        resolution_layout = QtWidgets.QFormLayout()
+        resolution_layout.addRow("Preset:", self.resolution_combo)
+        resolution_layout.addRow("Width:", self.width_field)
+        resolution_layout.addRow("Height:", self.height_field)
         self.resolution_group.setLayout(resolution_layout)
         
         # Frame range group layout
-        frame_range_layout = QtWidgets.QGridLayout()
-        frame_range_layout.addWidget(self.frame_range_label, 0, 0)
-        frame_range_layout.addWidget(self.frame_range_combo, 0, 1)
-        frame_range_layout.addWidget(self.start_frame_label, 1, 0)
-        frame_range_layout.addWidget(self.start_frame_field, 1, 1)
-        frame_range_layout.addWidget(self.end_frame_label, 2, 0)
-        frame_range_layout.addWidget(self.end_frame_field, 2, 1)
+        frame_range_layout = QtWidgets.QFormLayout()
+        frame_range_layout.addRow("Preset:", self.frame_range_combo)
+        frame_range_layout.addRow("Start:", self.start_frame_field)
+        frame_range_layout.addRow("End:", self.end_frame_field)
         self.frame_range_group.setLayout(frame_range_layout)
         
         # Format group layout
-        format_layout = QtWidgets.QGridLayout()
-        format_layout.addWidget(self.format_label, 0, 0)
-        format_layout.addWidget(self.format_combo, 0, 1)
-        format_layout.addWidget(self.encoder_label, 1, 0)
-        format_layout.addWidget(self.encoder_combo, 1, 1)
-        format_layout.addWidget(self.quality_label, 2, 0)
-        format_layout.addWidget(self.quality_combo, 2, 1)
+        format_layout = QtWidgets.QFormLayout()
+        format_layout.addRow("Format:", self.format_combo)
+        format_layout.addRow("Encoder:", self.encoder_combo)
+        format_layout.addRow("Quality:", self.quality_combo)
         self.format_group.setLayout(format_layout)
         
         # Shot mask group layout
-        shot_mask_layout = QtWidgets.QGridLayout()
-        shot_mask_layout.addWidget(self.shot_mask_checkbox, 0, 0, 1, 2)
-        shot_mask_layout.addWidget(self.topLeftLabel, 1, 0)
-        shot_mask_layout.addWidget(self.topLeftLineEdit, 1, 1)
-        shot_mask_layout.addWidget(self.topCenterLabel, 2, 0)
-        shot_mask_layout.addWidget(self.topCenterLineEdit, 2, 1)
-        shot_mask_layout.addWidget(self.topRightLabel, 3, 0)
-        shot_mask_layout.addWidget(self.topRightLineEdit, 3, 1)
-        shot_mask_layout.addWidget(self.bottomLeftLabel, 4, 0)
-        shot_mask_layout.addWidget(self.bottomLeftLineEdit, 4, 1)
-        shot_mask_layout.addWidget(self.bottomCenterLabel, 5, 0)
-        shot_mask_layout.addWidget(self.bottomCenterLineEdit, 5, 1)
-        shot_mask_layout.addWidget(self.bottomRightLabel, 6, 0)
-        shot_mask_layout.addWidget(self.bottomRightLineEdit, 6, 1)
-        self.shot_mask_group.setLayout(shot_mask_layout)
+        self.shot_mask_layout = QtWidgets.QFormLayout(self.shot_mask_body)
+        self.shot_mask_layout.setContentsMargins(0, 0, 0, 0)
+        shot_mask_group_layout = QtWidgets.QVBoxLayout()
+        shot_mask_group_layout.addWidget(self.shot_mask_checkbox)
+        shot_mask_group_layout.addWidget(self.shot_mask_body)
+        self.shot_mask_group.setLayout(shot_mask_group_layout)
         
         # Options group layout
         options_layout = QtWidgets.QVBoxLayout()
@@ -222,8 +289,28 @@ class PlayblastDialog(QtWidgets.QDialog):
         main_layout.addWidget(self.options_group)
         main_layout.addLayout(button_layout)
     
+    def create_shot_mask_widgets(self):
+        """Build the shot mask text fields the first time they are needed."""
+        if self._shot_mask_built:
+            return
+        self._shot_mask_built = True
+        for prefix, label_text, default_text in self.SHOT_MASK_FIELDS:
+            line_edit = QtWidgets.QLineEdit(default_text)
+            setattr(self, f"{prefix}LineEdit", line_edit)
+            self.shot_mask_layout.addRow(label_text, line_edit)
+    
     def create_connections(self):
-        # Connect signals and slots
+        # Connect signals and slots; the field signals are connected on first show
+        self._fields_connected = False
+        self.reset_button.clicked.connect(self.reset_settings)
+        self.playblast_button.clicked.connect(self.create_playblast)
+        self.cancel_button.clicked.connect(self.close)
+    
+    def create_field_connections(self):
+        """Connect the settings widgets' signals, once, before the dialog is first shown."""
+        if self._fields_connected:
+            return
+        self._fields_connected = True
         self.output_dir_browse.clicked.connect(self.browse_output_dir)
         self.camera_combo.currentTextChanged.connect(self.on_camera_changed)
         self.resolution_combo.currentTextChanged.connect(self.on_resolution_changed)
@@ -232,18 +319,76 @@ class PlayblastDialog(QtWidgets.QDialog):
         self.encoder_combo.currentTextChanged.connect(self.on_encoder_changed)
         
         self.shot_mask_checkbox.toggled.connect(self.on_shot_mask_toggled)
-        
-        self.reset_button.clicked.connect(self.reset_settings)
-        self.playblast_button.clicked.connect(self.create_playblast)
-        self.cancel_button.clicked.connect(self.close)
+    
+    def _add_scene_callbacks(self):
+        """Invalidate the cached Maya queries whenever a scene is created or opened."""
+        if not self._scene_callback_ids:
+            self._scene_callback_ids = [
+                om.MSceneMessage.addCallback(message, self._on_scene_changed)
+                for message in (om.MSceneMessage.kAfterNew, om.MSceneMessage.kAfterOpen)
+            ]
+    
+    def _remove_scene_callbacks(self):
+        if self._scene_callback_ids:
+            om.MMessage.removeCallbacks(self._scene_callback_ids)
+            self._scene_callback_ids = []
+    
+    def _on_scene_changed(self, *args):
+        self._camera_cache = None
+        self._workspace_root = None
+        if self.isVisible():
+            self.update_ui()
+        else:
+            self._ui_stale = True
+    
+    def get_cameras(self):
+        """Get the scene cameras, queried once per scene."""
+        if self._camera_cache is None:
+            self._camera_cache = cmds.listCameras()
+        return self._camera_cache
+    
+    def get_workspace_root(self):
+        """Get the workspace root directory, queried once per scene."""
+        if self._workspace_root is None:
+            self._workspace_root = cmds.workspace(q=True, rootDirectory=True)
+        return self._workspace_root
+    
+    def showEvent(self, event):
+        if not self._scene_callback_ids:
+            # Scenes may have changed while the dialog was closed
+            self._add_scene_callbacks()
+            self._on_scene_changed()
+        elif self._ui_stale:
+            # Hidden rather than closed, with the scene changed since
+            self.update_ui()
+        self.create_shot_mask_widgets()
+        self.create_field_connections()
+        super(PlayblastDialog, self).showEvent(event)
+    
+    def closeEvent(self, event):
+        self._remove_scene_callbacks()
+        super(PlayblastDialog, self).closeEvent(event)
     
     def update_ui(self):
-        # Populate camera combobox
-        self.camera_combo.clear()
-        self.camera_combo.addItem(presets.DEFAULT_CAMERA)
-        for camera in cmds.listCameras():
-            self.camera_combo.addItem(camera)
-        
+        self._ui_stale = False
+        # Populate camera combobox, only touching the cameras that changed
+        cameras = self.get_cameras()
+        listed = [self.camera_combo.itemText(i) for i in range(1, self.camera_combo.count())]
+        if listed != cameras:
+            with QtCore.QSignalBlocker(self.camera_combo):
+                keep = set(cameras)
+                for index in reversed(range(1, self.camera_combo.count())):
+                    if self.camera_combo.itemText(index) not in keep:
+                        self.camera_combo.removeItem(index)
+                listed = set(listed)
+                for camera in cameras:
+                    if camera not in listed:
+                        self.camera_combo.addItem(camera)
+        
+        self._apply_dependent_state()
+    
+    def _apply_dependent_state(self):
+        """Fill the fields that follow from the preset combo boxes, once each."""
         # Set initial frame range
         self.on_frame_range_changed(self.frame_range_combo.currentText())
         
@@ -257,7 +402,7 @@ class PlayblastDialog(QtWidgets.QDialog):
         directory = QtWidgets.QFileDialog.getExistingDirectory(
             self, 
             "Select Output Directory",
-            self.output_dir_field.text() or cmds.workspace(q=True, rootDirectory=True)
+            self.output_dir_field.text() or self.get_workspace_root()
         )
         if directory:
             self.output_dir_field.setText(directory)
@@ -269,8 +414,9 @@ class PlayblastDialog(QtWidgets.QDialog):
     def on_resolution_changed(self, preset_name):
         # Update resolution fields based on preset
         if preset_name == "Render":
-            self.width_field.setValue(cmds.getAttr("defaultResolution.width"))
-            self.height_field.setValue(cmds.getAttr("defaultResolution.height"))
+            width, height = _mel_query_pair("getAttr defaultResolution.width", "getAttr defaultResolution.height")
+            self.width_field.setValue(width)
+            self.height_field.setValue(height)
         elif preset_name in presets.RESOLUTION_PRESETS:
             dimensions = presets.RESOLUTION_PRESETS.get(preset_name)
             if dimensions:  # Check if not None
@@ -279,72 +425,68 @@ class PlayblastDialog(QtWidgets.QDialog):
     
     def on_frame_range_changed(self, preset_name):
         # Update frame range fields based on preset
-        if preset_name == "Playback":
-            start = cmds.playbackOptions(q=True, minTime=True)
-            end = cmds.playbackOptions(q=True, maxTime=True)
-        elif preset_name == "Animation":
-            start = cmds.playbackOptions(q=True, animationStartTime=True)
-            end = cmds.playbackOptions(q=True, animationEndTime=True)
-        elif preset_name == "Render":
-            start = cmds.getAttr("defaultRenderGlobals.startFrame")
-            end = cmds.getAttr("defaultRenderGlobals.endFrame")
-        else:  # Camera or Custom
+        queries = _FRAME_RANGE_QUERIES.get(preset_name)
+        if queries is None:  # Camera or Custom
             # Just keep current values
             return
         
+        start, end = _mel_query_pair(*queries)
         self.start_frame_field.setValue(start)
         self.end_frame_field.setValue(end)
     
     def on_format_changed(self, format_name):
-        # Update encoder options based on format
-        self.encoder_combo.clear()
-        if format_name in presets.VIDEO_ENCODERS:
-            self.encoder_combo.addItems(presets.VIDEO_ENCODERS[format_name])
-            if presets.VIDEO_ENCODERS[format_name]:
-                self.encoder_combo.setCurrentText(presets.VIDEO_ENCODERS[format_name][0])
+        # Update encoder options based on format; quality is updated once below
+        with QtCore.QSignalBlocker(self.encoder_combo):
+            self._encoder_model.setStringList(list(_VIDEO_ENCODER_KEYS.get(format_name, ())))
+            self.encoder_combo.setCurrentIndex(0)
         
         self.on_encoder_changed(self.encoder_combo.currentText())
     
     def on_encoder_changed(self, encoder_name):
         # Update quality options based on encoder
-        self.quality_combo.clear()
         if encoder_name == "h264":
-            self.quality_combo.addItems(list(presets.H264_QUALITIES.keys()))
+            self._quality_model.setStringList(list(_H264_QUALITY_KEYS))
             self.quality_combo.setCurrentText(presets.DEFAULT_H264_QUALITY)
-        elif encoder_name == "prores" and hasattr(presets, "PRORES_PROFILES"):
-            self.quality_combo.addItems(list(presets.PRORES_PROFILES.keys()))
+        elif encoder_name == "prores" and _PRORES_KEYS:
+            self._quality_model.setStringList(list(_PRORES_KEYS))
             self.quality_combo.setCurrentText("ProRes 422 HQ")
         else:  # Image formats
-            self.quality_combo.addItem("100")
+            self._quality_model.setStringList(["100"])
+            self.quality_combo.setCurrentIndex(0)
     
     def on_shot_mask_toggled(self, enabled):
-        # Enable/disable shot mask settings
-        for widget in [
-            self.topLeftLabel, self.topLeftLineEdit,
-            self.topCenterLabel, self.topCenterLineEdit,
-            self.topRightLabel, self.topRightLineEdit,
-            self.bottomLeftLabel, self.bottomLeftLineEdit,
-            self.bottomCenterLabel, self.bottomCenterLineEdit,
-            self.bottomRightLabel, self.bottomRightLineEdit
-        ]:
-            widget.setEnabled(enabled)
+        # Enable/disable shot mask settings; the text fields follow their container
+        self.create_shot_mask_widgets()
+        self.shot_mask_body.setEnabled(enabled)
     
     def reset_settings(self):
-        # Reset all settings to defaults
-        result = QtWidgets.QMessageBox.question(
-            self, 
-            "Reset Settings", 
-            "Are you sure you want to reset all settings to defaults?",
-            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
-            QtWidgets.QMessageBox.No
-        )
-        
-        if result == QtWidgets.QMessageBox.Yes:
+        # Reset all settings to defaults once the user confirms. open() returns
+        # straight away instead of running a nested event loop like exec().
+        if self._reset_confirm is None:
+            self._reset_confirm = QtWidgets.QMessageBox(
+                QtWidgets.QMessageBox.Question,
+                "Reset Settings",
+                "Are you sure you want to reset all settings to defaults?",
+                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
+                self
+            )
+            self._reset_confirm.setDefaultButton(QtWidgets.QMessageBox.No)
+            self._reset_confirm.finished.connect(self._on_reset_confirmed)
+        self._reset_confirm.open()
+    
+    def _on_reset_confirmed(self, *args):
+        clicked = self._reset_confirm.standardButton(self._reset_confirm.clickedButton())
+        if clicked == QtWidgets.QMessageBox.Yes:
             self.filename_field.setText("{scene}_{camera}")
-            self.camera_combo.setCurrentText(presets.DEFAULT_CAMERA)
-            self.resolution_combo.setCurrentText(presets.DEFAULT_RESOLUTION)
-            self.frame_range_combo.setCurrentText(presets.DEFAULT_FRAME_RANGE)
-            self.format_combo.setCurrentText(presets.DEFAULT_OUTPUT_FORMAT)
+            # The dependent fields are filled once by update_ui below
+            with QtCore.QSignalBlocker(self.camera_combo), \
+                    QtCore.QSignalBlocker(self.resolution_combo), \
+                    QtCore.QSignalBlocker(self.frame_range_combo), \
+                    QtCore.QSignalBlocker(self.format_combo):
+                self.camera_combo.setCurrentText(presets.DEFAULT_CAMERA)
+                self.resolution_combo.setCurrentText(presets.DEFAULT_RESOLUTION)
+                self.frame_range_combo.setCurrentText(presets.DEFAULT_FRAME_RANGE)
+                self.format_combo.setCurrentText(presets.DEFAULT_OUTPUT_FORMAT)
             
             self.shot_mask_checkbox.setChecked(True)
             self.reset_shot_mask_settings()
@@ -357,12 +499,9 @@ class PlayblastDialog(QtWidgets.QDialog):
     def reset_shot_mask_settings(self):
         """Reset shot mask settings to defaults."""
         # Reset text fields to default values
-        self.topLeftLineEdit.setText("Scene: {scene}")
-        self.topCenterLineEdit.setText("")
-        self.topRightLineEdit.setText("FPS: {fps}")
-        self.bottomLeftLineEdit.setText("Artist: {username}")
-        self.bottomCenterLineEdit.setText("Date: {date}")
-        self.bottomRightLineEdit.setText("Frame: {counter}")
+        self.create_shot_mask_widgets()
+        for prefix, _, default_text in self.SHOT_MASK_FIELDS:
+            getattr(self, f"{prefix}LineEdit").setText(default_text)
         
         # Update the live shot mask (if one exists)
         self.update_shot_mask()
@@ -375,81 +514,58 @@ class PlayblastDialog(QtWidgets.QDialog):
         if utils.remove_shot_mask():
             # Recreate with new settings if shot mask is enabled
             if self.shot_mask_checkbox.isChecked():
-                settings = {
-                    "topLeftText": self.topLeftLineEdit.text(),
-                    "topCenterText": self.topCenterLineEdit.text(),
-                    "topRightText": self.topRightLineEdit.text(),
-                    "bottomLeftText": self.bottomLeftLineEdit.text(),
-                    "bottomCenterText": self.bottomCenterLineEdit.text(),
-                    "bottomRightText": self.bottomRightLineEdit.text()
-                }
+                settings = self._shot_mask_snapshot()
                 
-                import conestoga_playblast
                 camera = self.camera_combo.currentText()
                 if camera == presets.DEFAULT_CAMERA:
                     camera = None  # Use active viewport camera
                 
                 utils.create_shot_mask(
                     camera=camera,
-                    user_name=os.getenv("USER") or os.getenv("USERNAME") or "user"
+                    user_name=_CURRENT_USER
                 )
     
-    def create_playblast(self):
-        # Get all the configuration options from UI
-        import conestoga_playblast
-        
-        output_dir = self.output_dir_field.text() or os.path.join(cmds.workspace(q=True, rootDirectory=True), "movies")
-        filename = self.filename_field.text() or "{scene}_{camera}"
+    def _shot_mask_snapshot(self):
+        """Read the shot mask text fields into create_playblast's settings format."""
+        self.create_shot_mask_widgets()
+        return {
+            f"{prefix}Text": getattr(self, f"{prefix}LineEdit").text()
+            for prefix, _, _ in self.SHOT_MASK_FIELDS
+        }
+    
+    def _snapshot(self):
+        """
+        Read every option from the dialog in one pass.
         
+        Returns:
+            dict: Keyword arguments for conestoga_playblast.create_playblast.
+        """
         camera = self.camera_combo.currentText()
-        if camera == presets.DEFAULT_CAMERA:
-            camera = None  # Use active viewport camera
-        
-        width = self.width_field.value()
-        height = self.height_field.value()
-        
-        start_frame = self.start_frame_field.value()
-        end_frame = self.end_frame_field.value()
-        
-        format_type = self.format_combo.currentText()
-        encoder = self.encoder_combo.currentText()
-        quality = self.quality_combo.currentText()
-        
         shot_mask = self.shot_mask_checkbox.isChecked()
-        
-        show_in_viewer = self.show_in_viewer_checkbox.isChecked()
-        force_overwrite = self.overwrite_checkbox.isChecked()
-        
-        # Shot mask settings if enabled
-        shot_mask_settings = None
-        if shot_mask:
-            shot_mask_settings = {
-                "topLeftText": self.topLeftLineEdit.text(),
-                "topCenterText": self.topCenterLineEdit.text(),
-                "topRightText": self.topRightLineEdit.text(),
-                "bottomLeftText": self.bottomLeftLineEdit.text(), 
-                "bottomCenterText": self.bottomCenterLineEdit.text(),
-                "bottomRightText": self.bottomRightLineEdit.text()
-            }
+        return {
+            "camera": None if camera == presets.DEFAULT_CAMERA else camera,  # None uses the active viewport camera
+            "output_dir": self.output_dir_field.text() or os.path.join(self.get_workspace_root(), "movies"),
+            "filename": self.filename_field.text() or "{scene}_{camera}",
+            "width": self.width_field.value(),
+            "height": self.height_field.value(),
+            "start_frame": self.start_frame_field.value(),
+            "end_frame": self.end_frame_field.value(),
+            "format_type": self.format_combo.currentText(),
+            "encoder": self.encoder_combo.currentText(),
+            "quality": self.quality_combo.currentText(),
+            "shot_mask": shot_mask,
+            "shot_mask_settings": self._shot_mask_snapshot() if shot_mask else None,
+            "show_in_viewer": self.show_in_viewer_checkbox.isChecked(),
+            "force_overwrite": self.overwrite_checkbox.isChecked()
+        }
+    
+    def create_playblast(self):
+        # Get all the configuration options from UI
+        options = self._snapshot()
         
         # Call the playblast function
         try:
-            result = conestoga_playblast.create_playblast(
-                camera=camera,
-                output_dir=output_dir,
-                filename=filename,
-                width=width,
-                height=height,
-                start_frame=start_frame,
-                end_frame=end_frame,
-                format_type=format_type,
-                encoder=encoder,
-                quality=quality,
-                shot_mask=shot_mask,
-                shot_mask_settings=shot_mask_settings,
-                show_in_viewer=show_in_viewer,
-                force_overwrite=force_overwrite
-            )
+            result = _playblast_module().create_playblast(**options)
             
             if result:
                 QtWidgets.QMessageBox.information(
@@ -473,50 +589,43 @@ class PlayblastDialog(QtWidgets.QDialog):
                 f"An error occurred:\n{str(e)}"
             )
 
-# Function to show the playblast dialog
+# The open dialog, reused by show_playblast_dialog while it is alive
+_dialog_ref = None
+
 def show_playblast_dialog():
     """
     Show the main playblast dialog.
     
+    The dialog is built once and shown again on later calls while Maya still
+    holds it, instead of rebuilding its widgets every time.
+    
     Returns:
         PlayblastDialog: Instance of the dialog
     """
-    # Get Maya main window as parent
+    global _dialog_ref
     try:
-        parent = utils.get_maya_main_window()
-    except:
-        parent = None
-    
-    # Create and show dialog
-    dialog = PlayblastDialog(parent)
-    dialog.show()
-    
-    # Return dialog instance
-    return dialog
-
-def show_playblast_dialog():
-    """Show the main playblast dialog."""
-    print("Starting show_playblast_dialog function")
-    try:
-        # Get Maya main window as parent
-        print("Getting Maya main window")
-        try:
-            parent = utils.get_maya_main_window()
-        except Exception as e:
-            print(f"Error getting Maya window: {str(e)}")
-            parent = None
-        
-        print("Creating dialog")
-        dialog = PlayblastDialog(parent)
+        dialog = _dialog_ref() if _dialog_ref else None
+        if dialog is None:
+            # Get Maya main window as parent
+            try:
+                parent = utils.get_maya_main_window()
+            except Exception as e:
+                print(f"Error getting Maya window: {str(e)}")
+                parent = None
+            
+            dialog = PlayblastDialog(parent)
+            _dialog_ref = weakref.ref(dialog)
+        elif dialog.isVisible():
+            # A hidden or closed dialog is refreshed by its showEvent
+            dialog.update_ui()
         
-        print("Showing dialog")
         dialog.show()
-        
-        print("Dialog created and shown")
+        dialog.raise_()
+        dialog.activateWindow()
         return dialog
         
     except Exception as e:
         import traceback
         print(f"Error creating playblast dialog: {str(e)}")
         traceback.print_exc()
-        return None
\ No newline at end of file
+        return None